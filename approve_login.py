@@ -5,30 +5,148 @@ Use this script when Robinhood asks you to approve the login on your device.
 This script gives you plenty of time to click "Yes, it's me" in the app.
 """
 
+import functools
+import random
+import re
+import threading
 import time
-import robin_stocks.robinhood as robinhood
 from src.utils.credentials import RobinhoodCredentials
 from src.utils.logger import logger
 
+_BAR = "=" * 70
+_THIN = "-" * 70
+
+# Seconds between approval probes; the first probe fires almost immediately so a
+# quick tap on "Approve" is picked up without sitting out a long fixed sleep.
+APPROVAL_PROBE_DELAYS = (2, 4, 8, 15, 30, 60, 60)
+MAX_APPROVAL_WAIT = 180  # 3 minutes
+APPROVAL_REMINDER_INTERVAL = 30
+
+# Error text that means Robinhood wants the login approved on the device
+_CHALLENGE_RE = re.compile(r"challenge|403|'detail'", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials():
+    """Load the Robinhood credentials once per process."""
+    return RobinhoodCredentials()
+
+
+def _try_login(credentials):
+    """
+    Probe Robinhood once to see whether the pending login has been approved.
+
+    Returns True when the login succeeds and False while approval is still pending.
+    Any other error (bad credentials, network failure, ...) is raised, since waiting
+    longer cannot fix it.
+    """
+    import robin_stocks.robinhood as robinhood
+
+    try:
+        robinhood.login(
+            credentials.user,
+            credentials.password,
+            expiresIn=86400,
+            by_sms=True
+        )
+        return True
+    except Exception as e:
+        if not _CHALLENGE_RE.search(str(e)):
+            raise
+        logger.debug("Approval still pending: %s", e)
+        return False
+
+
+def _probe_until_approved(credentials, approved, stop, finished, errors, max_total_wait):
+    """
+    Background prober: retry the login on the backoff schedule and set approved on success.
+
+    Gives up when stop is set or max_total_wait has been spent. A probe error that is
+    not a pending approval ends probing; it is appended to errors for the caller.
+    finished is set however the prober exits.
+    """
+    waited = 0.0
+
+    try:
+        for delay in APPROVAL_PROBE_DELAYS:
+            remaining = max_total_wait - waited
+            if remaining <= 0:
+                return
+
+            pause = min(delay * (1 + random.uniform(0, 0.5)), remaining)
+            if stop.wait(pause):
+                return
+            waited += pause
+
+            if _try_login(credentials):
+                approved.set()
+                return
+    except Exception as e:
+        errors.append(e)
+    finally:
+        finished.set()
+
+
+def _wait_for_approval(credentials, max_total_wait=MAX_APPROVAL_WAIT):
+    """
+    Wait for device approval while a background thread probes the login.
+
+    Returns True the moment a probe succeeds, or False once max_total_wait is spent.
+    Raises the probe's error if it failed for any reason other than pending approval;
+    interactive_login_with_approval backs off and retries after it.
+    """
+    approved = threading.Event()
+    stop = threading.Event()
+    finished = threading.Event()
+    errors = []
+    prober = threading.Thread(
+        target=_probe_until_approved,
+        args=(credentials, approved, stop, finished, errors, max_total_wait),
+        name="approval-prober",
+        daemon=True,
+    )
+    prober.start()
+
+    deadline = time.monotonic() + max_total_wait
+    while not finished.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        logger.info("⏳ Waiting for approval... (%d seconds remaining)", remaining)
+        logger.info("   👉 Click 'Yes, it's me' in your Robinhood app NOW!")
+        finished.wait(timeout=min(APPROVAL_REMINDER_INTERVAL, remaining))
+
+    # Never leave a probe racing the caller's next login attempt
+    stop.set()
+    prober.join()
+
+    if errors:
+        raise errors[0]
+    return approved.is_set()
+
 
 def interactive_login_with_approval():
     """
     Interactive login that waits for device approval.
     """
-    credentials = RobinhoodCredentials()
+    # robin_stocks is slow to import; only load it once we actually log in
+    import robin_stocks.robinhood as robinhood
+
+    credentials = _get_credentials()
     
-    logger.info("=" * 70)
+    logger.info(_BAR)
     logger.info("🔐 Robinhood Interactive Login with Device Approval")
-    logger.info("=" * 70)
+    logger.info(_BAR)
     logger.info("User: %s", credentials.user)
-    logger.info("=" * 70)
+    logger.info(_BAR)
     
     max_attempts = 3
     
     for attempt in range(1, max_attempts + 1):
         logger.info("")
         logger.info("🔄 Login Attempt %d/%d", attempt, max_attempts)
-        logger.info("-" * 70)
+        logger.info(_THIN)
         
         try:
             # Initial login attempt
@@ -42,9 +160,9 @@ def interactive_login_with_approval():
                 by_sms=True
             )
             
-            logger.info("=" * 70)
+            logger.info(_BAR)
             logger.info("✅ Successfully logged in to Robinhood!")
-            logger.info("=" * 70)
+            logger.info(_BAR)
             return True
             
         except Exception as e:
@@ -52,11 +170,11 @@ def interactive_login_with_approval():
             logger.warning("Initial login failed: %s", error_str)
             
             # Check if it's a challenge/approval required
-            if "challenge" in error_str.lower() or "403" in error_str or "'detail'" in error_str:
+            if _CHALLENGE_RE.search(error_str):
                 logger.info("")
-                logger.info("=" * 70)
+                logger.info(_BAR)
                 logger.info("⚠️  DEVICE APPROVAL REQUIRED")
-                logger.info("=" * 70)
+                logger.info(_BAR)
                 logger.info("Robinhood is asking you to verify this login.")
                 logger.info("")
                 logger.info("📱 PLEASE DO THE FOLLOWING NOW:")
@@ -64,63 +182,43 @@ def interactive_login_with_approval():
                 logger.info("   2. Look for a notification or prompt")
                 logger.info("   3. Tap 'Yes, it's me' or 'Approve'")
                 logger.info("   4. Wait for the confirmation message")
-                logger.info("=" * 70)
-                logger.info("")
-                
-                # Give extended time for approval
-                total_wait = 180  # 3 minutes
-                chunk_size = 30  # Update every 30 seconds
-                
-                for elapsed in range(0, total_wait, chunk_size):
-                    remaining = total_wait - elapsed
-                    logger.info("⏳ Waiting for approval... (%d seconds remaining)", remaining)
-                    logger.info("   👉 Click 'Yes, it's me' in your Robinhood app NOW!")
-                    time.sleep(chunk_size)
-                
+                logger.info(_BAR)
                 logger.info("")
-                logger.info("Checking if login was approved...")
-                time.sleep(2)
                 
-                # Try to verify the approval
                 try:
-                    robinhood.login(
-                        credentials.user,
-                        credentials.password,
-                        expiresIn=86400,
-                        by_sms=True
-                    )
-                    
-                    logger.info("=" * 70)
-                    logger.info("✅ Login approved and verified successfully!")
-                    logger.info("=" * 70)
-                    return True
-                    
+                    if _wait_for_approval(credentials):
+                        logger.info(_BAR)
+                        logger.info("✅ Login approved and verified successfully!")
+                        logger.info(_BAR)
+                        return True
+                    logger.error("Login was not approved within %d seconds", MAX_APPROVAL_WAIT)
                 except Exception as verify_error:
-                    logger.error("Verification after approval failed: %s", verify_error)
-                    
-                    if attempt < max_attempts:
-                        wait_time = 20 * attempt
-                        logger.info("")
-                        logger.info("Waiting %d seconds before retry...", wait_time)
-                        time.sleep(wait_time)
-                    else:
-                        logger.error("")
-                        logger.error("=" * 70)
-                        logger.error("❌ All login attempts failed")
-                        logger.error("=" * 70)
-                        logger.error("Possible issues:")
-                        logger.error("  • You didn't approve the login in time")
-                        logger.error("  • Account requires additional verification")
-                        logger.error("  • IP address may be temporarily blocked")
-                        logger.error("  • Incorrect credentials")
-                        logger.error("")
-                        logger.error("What to do:")
-                        logger.error("  1. Log into Robinhood app/website directly")
-                        logger.error("  2. Complete any pending security verifications")
-                        logger.error("  3. Wait 15-30 minutes and try again")
-                        logger.error("  4. Check your credentials in .env file")
-                        logger.error("=" * 70)
-                        return False
+                    # A failed probe (network error, timeout, ...) uses up this attempt, not the rest
+                    logger.error("Approval check failed: %s", verify_error)
+                
+                if attempt < max_attempts:
+                    wait_time = 20 * attempt
+                    logger.info("")
+                    logger.info("Waiting %d seconds before retry...", wait_time)
+                    time.sleep(wait_time)
+                else:
+                    logger.error("")
+                    logger.error(_BAR)
+                    logger.error("❌ All login attempts failed")
+                    logger.error(_BAR)
+                    logger.error("Possible issues:")
+                    logger.error("  • You didn't approve the login in time")
+                    logger.error("  • Account requires additional verification")
+                    logger.error("  • IP address may be temporarily blocked")
+                    logger.error("  • Incorrect credentials")
+                    logger.error("")
+                    logger.error("What to do:")
+                    logger.error("  1. Log into Robinhood app/website directly")
+                    logger.error("  2. Complete any pending security verifications")
+                    logger.error("  3. Wait 15-30 minutes and try again")
+                    logger.error("  4. Check your credentials in .env file")
+                    logger.error(_BAR)
+                    return False
             else:
                 logger.error("Unexpected error: %s", e)
                 if attempt < max_attempts:
@@ -132,6 +230,8 @@ def interactive_login_with_approval():
 
 def main():
     """Main function."""
+    import robin_stocks.robinhood as robinhood
+
     logger.info("")
     logger.info("This script will help you log into Robinhood when device approval is needed.")
     logger.info("")
@@ -4,17 +4,30 @@ Debug script to inspect what Robinhood API is actually returning.
 This will help us understand why authentication is failing.
 """
 
+import functools
 import requests
 import json
 from src.utils.credentials import RobinhoodCredentials
 from src.utils.logger import logger
 
+_BAR = "=" * 70
+
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials():
+    """Load the Robinhood credentials once per process."""
+    return RobinhoodCredentials()
+
+
+# Shared session so repeated probes reuse the TCP/TLS connection
+_SESSION = requests.Session()
+
 
 def debug_robinhood_response():
     """
     Make a raw API call to see what Robinhood is actually returning.
     """
-    credentials = RobinhoodCredentials()
+    credentials = _get_credentials()
     
     url = "https://api.robinhood.com/oauth2/token/"
     
@@ -29,19 +42,19 @@ def debug_robinhood_response():
         'device_token': '1234567890abcdef'
     }
     
-    logger.info("=" * 70)
+    logger.info(_BAR)
     logger.info("🔍 Debugging Robinhood API Response")
-    logger.info("=" * 70)
+    logger.info(_BAR)
     logger.info("User: %s", credentials.user)
     logger.info("URL: %s", url)
-    logger.info("=" * 70)
+    logger.info(_BAR)
     
     try:
-        response = requests.post(url, json=payload)
+        response = _SESSION.post(url, json=payload, timeout=10.0)
         
         logger.info("Status Code: %d", response.status_code)
         logger.info("Headers: %s", dict(response.headers))
-        logger.info("=" * 70)
+        logger.info(_BAR)
         
         # Try to parse as JSON
         try:
@@ -52,7 +65,7 @@ def debug_robinhood_response():
             logger.info("Response Body (Raw Text):")
             logger.info(response.text)
         
-        logger.info("=" * 70)
+        logger.info(_BAR)
         
         # Check what's in the response
         if response.status_code == 403:
@@ -80,7 +93,7 @@ def debug_robinhood_response():
             elif 'access_token' in data:
                 logger.info("✅ Access token received - login successful!")
         
-        logger.info("=" * 70)
+        logger.info(_BAR)
         logger.info("")
         logger.info("💡 Analysis:")
         
@@ -105,7 +118,7 @@ def debug_robinhood_response():
                 logger.warning("  Response is not valid JSON!")
                 logger.info("  Raw response: %s", response.text[:500])
         
-        logger.info("=" * 70)
+        logger.info(_BAR)
         
         # Recommendations
         logger.info("")
@@ -129,7 +142,7 @@ def debug_robinhood_response():
             logger.info("  5. Contact Robinhood support if issue persists")
             logger.info("     They may have locked your API access")
         
-        logger.info("=" * 70)
+        logger.info(_BAR)
         
     except Exception as e:
         logger.error("Error making request: %s", e)
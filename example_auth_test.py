@@ -12,14 +12,16 @@ from src.core.base_trade_bot import TradeBot
 from src.core.config import TradingConfig, StrategyType
 from src.utils.logger import logger
 
+_BAR = "=" * 60
+
 
 def test_authentication():
     """
     Test the authentication flow without executing any trades.
     """
-    logger.info("=" * 60)
+    logger.info(_BAR)
     logger.info("Starting Robinhood Authentication Test")
-    logger.info("=" * 60)
+    logger.info(_BAR)
     
     try:
         # Create a minimal valid configuration
@@ -35,44 +37,44 @@ def test_authentication():
         # The authentication happens in __init__
         with TradeBot(config=config) as bot:
             logger.info("✓ Authentication successful!")
-            logger.info("=" * 60)
+            logger.info(_BAR)
             logger.info("Authentication Details:")
             logger.info("  - Connection: Established")
             logger.info("  - Status: Ready for trading")
-            logger.info("=" * 60)
+            logger.info(_BAR)
             
             # Get account info to verify connection
             try:
                 cash_position = bot.get_current_cash_position()
-                logger.info(f"Current Cash Position: ${cash_position:.2f}")
+                logger.info("Current Cash Position: $%.2f", cash_position)
             except Exception as e:
-                logger.warning(f"Could not retrieve cash position: {e}")
+                logger.warning("Could not retrieve cash position: %s", e)
             
-            logger.info("=" * 60)
+            logger.info(_BAR)
             logger.info("Authentication test completed successfully!")
             logger.info("You can now use the bot for trading operations.")
-            logger.info("=" * 60)
+            logger.info(_BAR)
             
     except ConnectionError as e:
-        logger.error("=" * 60)
+        logger.error(_BAR)
         logger.error("Authentication Failed")
-        logger.error("=" * 60)
-        logger.error(f"Error: {e}")
+        logger.error(_BAR)
+        logger.error("Error: %s", e)
         logger.error("")
         logger.error("Troubleshooting Steps:")
         logger.error("1. Check your credentials in .env file")
         logger.error("2. Verify your Robinhood account status")
         logger.error("3. Try adding ROBINHOOD_MFA_CODE to .env")
         logger.error("4. Wait 15-30 minutes if rate-limited")
-        logger.error("=" * 60)
+        logger.error(_BAR)
         raise
     
     except Exception as e:
-        logger.error("=" * 60)
+        logger.error(_BAR)
         logger.error("Unexpected Error")
-        logger.error("=" * 60)
-        logger.error(f"Error: {e}")
-        logger.error("=" * 60)
+        logger.error(_BAR)
+        logger.error("Error: %s", e)
+        logger.error(_BAR)
         raise
 
 
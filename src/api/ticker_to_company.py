@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import functools
 import json
 import os
 import pathlib
-import urllib.error
-import urllib.request
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import aiohttp
+except ImportError:  # optional: async lookups fall back to the thread pool
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json handles the cache file too, just slower
+    orjson = None
 
 # 1) your legacy/static fallback
 _STATIC_TICKER_TO_COMPANY: dict[str, str] = {
@@ -28,7 +46,18 @@ CACHE_PATH = pathlib.Path(".ticker_cache.json")
 
 # 3) pick a remote source
 #    - Alpha Vantage unofficial endpoints can give you company info by ticker.
-#    Below is a tiny Alpha Vantage-like fetcher (no extra deps).
+#    Below is a tiny Alpha Vantage-like fetcher over a shared keep-alive session.
+_REMOTE_WORKERS = 8
+
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
 
 
 def _fetch_name_from_alpha_vantage(ticker: str) -> str | None:
@@ -36,18 +65,48 @@ def _fetch_name_from_alpha_vantage(ticker: str) -> str | None:
     Fetch company name for a ticker from a Alpha Vantage-like endpoint.
     This mirrors the idea shown in multiple Alpha Vantage Finance examples.
     """
+    url = _alpha_vantage_url(ticker)
+    if not url:
+        return None
+
+    try:
+        resp = _SESSION.get(url, timeout=5)
+        resp.raise_for_status()
+        data = resp.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    return _parse_alpha_vantage_name(data)
+
+
+async def _afetch_name_from_alpha_vantage(session: "aiohttp.ClientSession", ticker: str) -> str | None:
+    """Async twin of _fetch_name_from_alpha_vantage for use with a shared aiohttp session."""
+    url = _alpha_vantage_url(ticker)
+    if not url:
+        return None
+
+    try:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            data = await resp.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+
+    return _parse_alpha_vantage_name(data)
+
+
+def _alpha_vantage_url(ticker: str) -> str | None:
+    """Build the Alpha Vantage OVERVIEW URL, or None when no API key is configured."""
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
     if not api_key:
         return None
 
     # endpoint that returns quote summary-ish JSON; there are many variants in the wild
-    url = f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={ticker}&apikey={api_key}"
-    try:
-        with urllib.request.urlopen(url, timeout=5) as resp:
-            data = json.load(resp)
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError):
-        return None
+    return f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={ticker}&apikey={api_key}"
 
+
+def _parse_alpha_vantage_name(data: object) -> str | None:
+    """Pull the company name out of an Alpha Vantage OVERVIEW payload."""
     try:
         return data["Name"]
     except (KeyError, TypeError, IndexError):
@@ -55,29 +114,117 @@ def _fetch_name_from_alpha_vantage(ticker: str) -> str | None:
 
 
 # 4) file cache helpers --------------------------------------------------------
-def _load_cache() -> dict[str, str]:
-    """Load the ticker cache from a local file, safely handling errors."""
+# The file is read once per process into memory and written back at exit. It holds
+# resolved names under "hits" and, under "misses", the time each unresolvable ticker
+# last failed so restarts don't hit the network for it again within _MISS_TTL.
+_MISS_TTL = 86400  # 1 day
+_MEM_CACHE: dict[str, str] | None = None
+_MISS_CACHE: dict[str, float] = {}
+_DIRTY = False
+_CACHE_LOCK = threading.Lock()
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialise the cache file contents, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _loads(raw: bytes) -> object:
+    """Parse the cache file contents, preferring orjson when available."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _read_cache_file() -> tuple[dict[str, str], dict[str, float]]:
+    """Load the ticker cache (hits, misses) from a local file, safely handling errors."""
     if not CACHE_PATH.is_file():
-        return {}
+        return {}, {}
     try:
-        data = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        data = _loads(CACHE_PATH.read_bytes())
         if not isinstance(data, dict):
-            return {}
+            return {}, {}
+        # files written before misses were tracked are a flat ticker -> name mapping
+        hits = data.get("hits", {}) if "hits" in data else data
+        misses = data.get("misses", {})
+        if not isinstance(hits, dict) or not isinstance(misses, dict):
+            return {}, {}
         # Filter for string keys and non-empty string values to ensure type safety
-        return {k: v for k, v in data.items() if isinstance(k, str) and isinstance(v, str) and v}
+        return (
+            {k: v for k, v in hits.items() if isinstance(k, str) and isinstance(v, str) and v},
+            {k: float(v) for k, v in misses.items() if isinstance(k, str) and isinstance(v, (int, float))},
+        )
     except (json.JSONDecodeError, OSError):
-        return {}
+        return {}, {}
+
+
+def _ensure_loaded() -> dict[str, str]:
+    """Return the in-memory cache of hits, loading hits and misses from disk on first use."""
+    global _MEM_CACHE
+    if _MEM_CACHE is None:
+        with _CACHE_LOCK:
+            if _MEM_CACHE is None:
+                hits, misses = _read_cache_file()
+                _MISS_CACHE.update(misses)
+                _MEM_CACHE = hits
+    return _MEM_CACHE
+
+
+def _remember(ticker: str, name: str) -> None:
+    """Store a resolved name in memory; it reaches disk on the next flush."""
+    global _DIRTY
+    cache = _ensure_loaded()
+    with _CACHE_LOCK:
+        cache[ticker] = name
+        _MISS_CACHE.pop(ticker, None)
+        _DIRTY = True
+
 
+def _remember_miss(ticker: str) -> None:
+    """Record that the remote source could not resolve ticker just now."""
+    global _DIRTY
+    _ensure_loaded()
+    with _CACHE_LOCK:
+        _MISS_CACHE[ticker] = time.time()
+        _DIRTY = True
 
-def _save_cache(cache: dict[str, str]) -> None:
-    """Save the ticker cache to a local file."""
+
+def _is_recent_miss(ticker: str) -> bool:
+    """True if ticker failed to resolve within _MISS_TTL; stale entries are dropped."""
+    global _DIRTY
+    _ensure_loaded()
+    with _CACHE_LOCK:
+        failed_at = _MISS_CACHE.get(ticker)
+        if failed_at is None:
+            return False
+        if time.time() - failed_at < _MISS_TTL:
+            return True
+        del _MISS_CACHE[ticker]
+        _DIRTY = True
+        return False
+
+
+def _flush_if_dirty() -> None:
+    """Atomically write the in-memory cache to disk if it has changed."""
+    global _DIRTY
+    with _CACHE_LOCK:
+        if not _DIRTY or _MEM_CACHE is None:
+            return
+        snapshot = {"hits": dict(_MEM_CACHE), "misses": dict(_MISS_CACHE)}
+        _DIRTY = False
+
+    tmp_path = CACHE_PATH.with_name(CACHE_PATH.name + ".tmp")
     try:
-        CACHE_PATH.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
-    except (OSError, ValueError):
+        tmp_path.write_bytes(_dumps(snapshot))
+        os.replace(tmp_path, CACHE_PATH)
+    except (OSError, TypeError, ValueError):
         # cache is best-effort
         pass
 
 
+atexit.register(_flush_if_dirty)
+
+
 # 5) public API ----------------------------------------------------------------
 @functools.lru_cache(maxsize=2048)
 def get_company_name(ticker: str) -> str | None:
@@ -91,23 +238,98 @@ def get_company_name(ticker: str) -> str | None:
     if not t:
         return None
 
-    # 1) check file cache
-    cache = _load_cache()
-    if t in cache:
-        return cache[t]
+    # 1) check in-memory cache (loaded from the file once)
+    cached = _ensure_loaded().get(t)
+    if cached:
+        return cached
 
-    # 2) try remote
-    name = _fetch_name_from_alpha_vantage(t)
-
-    if name:
-        cache[t] = name
-        _save_cache(cache)
-        return name
+    # 2) try remote, unless it already failed for this ticker recently
+    if not _is_recent_miss(t):
+        name = _fetch_name_from_alpha_vantage(t)
+        if name:
+            _remember(t, name)
+            return name
+        if os.getenv("ALPHA_VANTAGE_API_KEY"):
+            _remember_miss(t)
 
     # 3) final fallback
     return _STATIC_TICKER_TO_COMPANY.get(t)
 
 
+def _resolve_locally(tickers: Iterable[str]) -> tuple[dict[str, str | None], list[str]]:
+    """Resolve what we can without the network; return (names, tickers still missing)."""
+    wanted = [t for t in dict.fromkeys(ticker.upper().strip() for ticker in tickers) if t]
+    names: dict[str, str | None] = {}
+    cache = _ensure_loaded()
+    misses = []
+
+    for t in wanted:
+        name = cache.get(t) or _STATIC_TICKER_TO_COMPANY.get(t)
+        if name:
+            names[t] = name
+        elif _is_recent_miss(t):
+            names[t] = None
+        else:
+            misses.append(t)
+
+    return names, misses
+
+
+def _record_remote(names: dict[str, str | None], fetched: dict[str, str | None]) -> dict[str, str | None]:
+    """Merge remote results into names, caching hits and remembering misses."""
+    remote_configured = bool(os.getenv("ALPHA_VANTAGE_API_KEY"))
+    for t, name in fetched.items():
+        names[t] = name
+        if name:
+            _remember(t, name)
+        elif remote_configured:
+            _remember_miss(t)
+    return names
+
+
+def get_company_names(tickers: Iterable[str]) -> dict[str, str | None]:
+    """
+    Resolve a batch of tickers in one pass.
+
+    Cached and static names are used before going to the network, and the remaining
+    misses are fetched concurrently.
+    """
+    names, misses = _resolve_locally(tickers)
+    if not misses:
+        return names
+
+    with ThreadPoolExecutor(max_workers=min(_REMOTE_WORKERS, len(misses))) as pool:
+        fetched = dict(zip(misses, pool.map(_fetch_name_from_alpha_vantage, misses)))
+
+    return _record_remote(names, fetched)
+
+
+async def aget_company_names(tickers: Iterable[str]) -> dict[str, str | None]:
+    """
+    Async variant of get_company_names that issues all remote lookups concurrently.
+
+    Requires aiohttp; without it the lookups run on the thread pool instead.
+    """
+    if aiohttp is None:
+        return await asyncio.to_thread(get_company_names, list(tickers))
+
+    names, misses = _resolve_locally(tickers)
+    if not misses:
+        return names
+
+    connector = aiohttp.TCPConnector(limit=_REMOTE_WORKERS, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=5)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(*(_afetch_name_from_alpha_vantage(session, t) for t in misses))
+
+    return _record_remote(names, dict(zip(misses, results)))
+
+
+def get_company_names_parallel(tickers: Iterable[str]) -> dict[str, str | None]:
+    """Synchronous wrapper around aget_company_names for callers without an event loop."""
+    return asyncio.run(aget_company_names(tickers))
+
+
 # 6) if you still want a dict-like object:
 class DynamicTickerMap(dict[str, str]):
     """
@@ -124,5 +346,12 @@ class DynamicTickerMap(dict[str, str]):
         self[key] = name
         return name
 
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """dict.get bypasses __missing__; route it through the same resolver."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 
 TICKER_TO_COMPANY = DynamicTickerMap(_STATIC_TICKER_TO_COMPANY)
@@ -1,9 +1,11 @@
 """This module contains the base class for all trading bots."""
 
+import re
 import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 import robin_stocks.robinhood as robinhood
 
@@ -17,10 +19,14 @@ from src.strategies.trading_strategies import (
     calculate_sma_signal,
     calculate_volatility,
     calculate_vwap_signal,
+    precompute_indicators,
 )
 from src.utils.credentials import RobinhoodCredentials
 from src.utils.logger import logger
 
+# Error text that means Robinhood wants the login approved on the device
+_CHALLENGE_RE = re.compile(r"challenge|403", re.IGNORECASE)
+
 
 class TradeBot:
     """
@@ -75,7 +81,7 @@ class TradeBot:
                         error_str = str(mfa_error)
                         
                         # Check if it's a challenge requiring device approval
-                        if "challenge" in error_str.lower() or "403" in error_str:
+                        if _CHALLENGE_RE.search(error_str):
                             logger.warning("✗ Device verification required (not just MFA)")
                             logger.info("Robinhood needs you to approve this login on your device.")
                         else:
@@ -101,7 +107,7 @@ class TradeBot:
                     error_str = str(sms_error)
                     
                     # Check if this is a challenge/verification prompt
-                    if "challenge" in error_str.lower() or "403" in error_str:
+                    if _CHALLENGE_RE.search(error_str):
                         logger.info("=" * 60)
                         logger.info("⚠️  DEVICE VERIFICATION REQUIRED")
                         logger.info("=" * 60)
@@ -257,6 +263,8 @@ class TradeBot:
         if StrategyType.SENTIMENT in self.config.enabled_strategies:
             signals[StrategyType.SENTIMENT] = calculate_sentiment_signal(ticker, self.config.sentiment_analysis)
 
+        # Resampling drops bars without a close, so it can leave nothing to compute from
+        df = self.resample_to_decision_freq(df)
         if df.empty:
             # Set technical strategies to 0.0 if no historical data
             for strategy in self.config.enabled_strategies:
@@ -264,18 +272,18 @@ class TradeBot:
                     signals[strategy] = 0.0
             return signals
 
-        df["close"] = df["close_price"].astype(float)
-        df["volume"] = df["volume"].astype(float)
+        df["close"] = df["close_price"]
+        indicators = precompute_indicators(df, self.config.technical_indicators)
 
         for strategy in self.config.enabled_strategies:
             if strategy == StrategyType.SMA_CROSSOVER:
-                signals[strategy] = calculate_sma_signal(df, self.config.technical_indicators)
+                signals[strategy] = calculate_sma_signal(df, self.config.technical_indicators, indicators)
             elif strategy == StrategyType.VWAP:
-                signals[strategy] = calculate_vwap_signal(df, self.config.technical_indicators)
+                signals[strategy] = calculate_vwap_signal(df, self.config.technical_indicators, indicators)
             elif strategy == StrategyType.RSI:
-                signals[strategy] = calculate_rsi_signal(df, self.config.technical_indicators)
+                signals[strategy] = calculate_rsi_signal(df, self.config.technical_indicators, indicators)
             elif strategy == StrategyType.MACD:
-                signals[strategy] = calculate_macd_signal(df, self.config.technical_indicators)
+                signals[strategy] = calculate_macd_signal(df, self.config.technical_indicators, indicators)
 
         return signals
 
@@ -403,12 +411,14 @@ class TradeBot:
             df = pd.DataFrame(historicals)
             df["begins_at"] = pd.to_datetime(df["begins_at"])
 
-            # Convert price columns to float
-            price_columns = ["open_price", "close_price", "high_price", "low_price"]
-            for col in price_columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+            # Convert price and volume columns to float32: ample precision for bars, and half
+            # the memory for the indicator passes to read (the kernels accumulate in float64)
+            numeric_columns = ["open_price", "close_price", "high_price", "low_price", "volume"]
+            for col in numeric_columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype(np.float32)
 
-            df["volume"] = pd.to_numeric(df["volume"], errors="coerce")
+            if "symbol" in df:
+                df["symbol"] = df["symbol"].astype("category")
 
             return df
 
@@ -416,6 +426,27 @@ class TradeBot:
             logger.error("Error fetching historical data for %s: %s", ticker, str(e))
             return pd.DataFrame()
 
+    def resample_to_decision_freq(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compress price history to the configured decision frequency.
+
+        :param df: A DataFrame as returned by get_stock_history_dataframe.
+        :return: OHLCV bars at config.decision_freq, or df unchanged when it is not set.
+        """
+        if not self.config.decision_freq or df.empty:
+            return df
+
+        bars = df.resample(self.config.decision_freq, on="begins_at").agg(
+            {
+                "open_price": "first",
+                "high_price": "max",
+                "low_price": "min",
+                "close_price": "last",
+                "volume": "sum",
+            }
+        )
+        return bars.dropna(subset=["close_price"]).reset_index()
+
     def get_current_cash_position(self) -> float:
         """Retrieve the current cash position available for trading."""
         try:
@@ -552,7 +583,7 @@ class TradeBot:
             if df.empty:
                 return float(position.get("average_buy_price", 0.0))
 
-            return df["high_price"].max()
+            return float(df["high_price"].max())
 
         except (KeyError, ValueError, pd.errors.EmptyDataError) as e:
             logger.error("Error calculating highest price: %s", str(e))
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, time, timedelta
 from enum import Enum, auto
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import numpy as np
 
@@ -55,6 +55,9 @@ class VWAPConfig:
     risk_per_trade: float = 0.02
     trailing_stop: float = 0.015
     mean_reversion_threshold: float = 2.0
+    # Seconds a fetched price history is reused before it is requested again
+    intraday_ttl: float = 30.0
+    daily_ttl: float = 3600.0
 
 
 @dataclass
@@ -187,6 +190,9 @@ class TradingConfig:
     market_hours_only: bool = True
     market_open: time = time(9, 30)
     market_close: time = time(16, 0)
+    # Resample bars to this pandas frequency (e.g. "1h", "1D") before computing
+    # indicators; None uses the bars as fetched
+    decision_freq: Optional[str] = None
 
     enabled_strategies: List[StrategyType] = field(
         default_factory=lambda: [
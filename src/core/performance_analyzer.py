@@ -1,9 +1,28 @@
 """This module contains the PerformanceAnalyzer class."""
 
+import time
 from datetime import datetime
 from typing import Any, Dict, List, TypedDict
 
-import pandas as pd
+import numpy as np
+
+TRADING_DAYS_PER_YEAR = 252
+
+_SIDE_CODES = {"buy": 1, "sell": -1}
+_SIDE_NAMES = {code: side for side, code in _SIDE_CODES.items()}
+
+# Trade keys stored in the columns; add_trade replaces any given timestamp with its own
+_COLUMN_KEYS = frozenset(["ticker", "quantity", "price", "profit_loss", "side", "timestamp"])
+
+# One column per recorded trade field; tickers are kept as Python strings of any length
+_TRADE_COLUMNS = {
+    "ts_ns": np.dtype(np.int64),
+    "ticker": np.dtype(object),
+    "quantity": np.dtype(np.float64),
+    "price": np.dtype(np.float64),
+    "pnl": np.dtype(np.float64),
+    "side": np.dtype(np.int8),
+}
 
 
 class PerformanceReport(TypedDict):
@@ -24,24 +43,75 @@ class PerformanceReport(TypedDict):
 class PerformanceAnalyzer:
     """A class to analyze the performance of a trading bot."""
 
+    _INITIAL_CAPACITY = 1024
+
     def __init__(self) -> None:
         """Initialize the PerformanceAnalyzer."""
-        self.trade_history: List[Dict[str, Any]] = []
-        self.daily_returns: pd.Series = pd.Series()
-        self.benchmark_returns: pd.Series = pd.Series()
+        # Trades live in preallocated parallel arrays, one per field, that double in
+        # capacity when full; _n is the number of trades recorded.
+        self._capacity = self._INITIAL_CAPACITY
+        self._columns = {name: np.empty(self._capacity, dtype=dtype) for name, dtype in _TRADE_COLUMNS.items()}
+        self._n = 0
+        # Any other keys a trade was recorded with, by trade index
+        self._extras: Dict[int, Dict[str, Any]] = {}
+
+    @property
+    def trade_history(self) -> List[Dict[str, Any]]:
+        """
+        The recorded trades as a list of dictionaries, oldest first.
+
+        This is a read-only snapshot built from the trade columns: it can no longer be
+        assigned, and appending to the returned list does not record a trade. Use
+        add_trade to record trades.
+        """
+        return [
+            {
+                **self._extras.get(i, {}),
+                "timestamp": datetime.fromtimestamp(ts_ns / 1e9),
+                "ticker": ticker,
+                "quantity": quantity,
+                "price": price,
+                "profit_loss": pnl,
+                "side": _SIDE_NAMES.get(side, "unknown"),
+            }
+            for i, (ts_ns, ticker, quantity, price, pnl, side) in enumerate(
+                zip(*(self._columns[name][: self._n].tolist() for name in _TRADE_COLUMNS))
+            )
+        ]
 
     def add_trade(self, trade: Dict[str, Any]) -> None:
         """
         Record a new trade with enhanced metrics.
 
+        ``ticker``, ``quantity``, ``price``, ``profit_loss`` and ``side`` are stored in the
+        trade columns and the trade is stamped with the current time. Any other keys are
+        kept alongside and returned with the trade by trade_history.
+
         :param trade: The trade to record.
         """
-        self.trade_history.append(
-            {
-                **trade,
-                "timestamp": datetime.now(),
-            }
-        )
+        if self._n == self._capacity:
+            self._grow()
+
+        i = self._n
+        columns = self._columns
+        columns["ts_ns"][i] = time.time_ns()
+        columns["ticker"][i] = trade.get("ticker", "")
+        columns["quantity"][i] = float(trade.get("quantity", 0.0))
+        columns["price"][i] = float(trade.get("price", 0.0))
+        columns["pnl"][i] = float(trade.get("profit_loss", 0.0))
+        columns["side"][i] = _SIDE_CODES.get(str(trade.get("side", "")).lower(), 0)
+        extras = {key: value for key, value in trade.items() if key not in _COLUMN_KEYS}
+        if extras:
+            self._extras[i] = extras
+        self._n += 1
+
+    def _grow(self) -> None:
+        """Double the capacity of every column, keeping the trades recorded so far."""
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[: self._n] = column[: self._n]
+            self._columns[name] = grown
 
     def get_performance_report(self) -> PerformanceReport:
         """
@@ -49,14 +119,25 @@ class PerformanceAnalyzer:
 
         :return: A dictionary containing the performance report.
         """
-        if not self.trade_history:
+        if self._n == 0:
             return self._empty_performance_report()
 
+        pnl = self._columns["pnl"][: self._n]
+        annualization = np.sqrt(TRADING_DAYS_PER_YEAR)
+
+        mean = np.mean(pnl, dtype=np.float64)
+        std = np.std(pnl, dtype=np.float64)
+        downside_std = np.sqrt(np.mean(np.minimum(pnl, 0.0) ** 2))
+
+        equity = np.cumsum(pnl)
+        peak = np.maximum.accumulate(equity)
+        drawdown = np.divide(peak - equity, peak, out=np.zeros_like(equity), where=peak > 0)
+
         metrics: PerformanceReport = {
             "total_return": 0.0,
-            "sharpe_ratio": 0.0,
-            "sortino_ratio": 0.0,
-            "max_drawdown": 0.0,
+            "sharpe_ratio": float(mean / std * annualization) if std > 0 else 0.0,
+            "sortino_ratio": float(mean / downside_std * annualization) if downside_std > 0 else 0.0,
+            "max_drawdown": float(drawdown.max()),
             "win_rate": 0.0,
             "profit_factor": 0.0,
             "risk_adjusted_return": 0.0,
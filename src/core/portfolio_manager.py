@@ -1,20 +1,25 @@
 """This module contains the PortfolioManager class."""
 
+import math
 from dataclasses import dataclass
-from typing import Dict
-
-import numpy as np
+from typing import Dict, Mapping, Optional
 
 from src.data.position import Position
+from src.data.positions_table import PositionsTable
+
+# Kelly fraction for the historical 55% win rate and 1.5 profit/loss ratio
+_WIN_RATE = 0.55
+_WIN_LOSS_RATIO = 1.5
+_KELLY_PERCENTAGE = (_WIN_RATE * _WIN_LOSS_RATIO - (1 - _WIN_RATE)) / _WIN_LOSS_RATIO
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioMetrics:
     """Data class for portfolio metrics."""
 
     total_equity: float
     cash_available: float
-    positions: Dict[str, Position]
+    positions: Mapping[str, Position]
     sector_exposure: Dict[str, float]
     beta_weighted_delta: float
     sharpe_ratio: float
@@ -33,30 +38,28 @@ class PortfolioManager:
         """
         self.initial_capital = initial_capital
         self.max_position_size = max_position_size
-        self.positions: Dict[str, Position] = {}
+        self.positions = PositionsTable()
 
-    def calculate_position_size(self, ticker: str, signal_strength: float, volatility: float) -> float:
+    def calculate_position_size(
+        self, ticker: str, signal_strength: float, volatility: float, cash_available: Optional[float] = None
+    ) -> float:
         """
         Calculate optimal position size using Kelly Criterion and volatility adjustment.
 
         :param ticker: The ticker symbol of the stock.
         :param signal_strength: The strength of the trading signal.
         :param volatility: The volatility of the stock.
+        :param cash_available: Cash to size against; pass it when sizing several tickers
+            in one rebalance so the portfolio metrics are only computed once.
         :return: The optimal position size.
         """
-        portfolio_metrics = self.get_portfolio_metrics()
-        available_capital = portfolio_metrics.cash_available
-
-        # Kelly Criterion calculation
-        win_rate = 0.55  # Historical win rate
-        win_loss_ratio = 1.5  # Historical profit/loss ratio
-        kelly_percentage = (win_rate * win_loss_ratio - (1 - win_rate)) / win_loss_ratio
+        available_capital = self.get_portfolio_metrics().cash_available if cash_available is None else cash_available
 
         # Volatility adjustment
-        vol_factor = np.exp(-volatility)
+        vol_factor = math.exp(-volatility)
 
         # Position size calculation
-        base_size = available_capital * kelly_percentage * vol_factor
+        base_size = available_capital * _KELLY_PERCENTAGE * vol_factor
         adjusted_size = base_size * abs(signal_strength)
 
         # Apply position limits
@@ -69,7 +72,7 @@ class PortfolioManager:
 
         :return: A PortfolioMetrics object.
         """
-        total_equity = sum(pos.equity for pos in self.positions.values())
+        total_equity = float(self.positions.equity.sum())
 
         return PortfolioMetrics(
             total_equity=total_equity,
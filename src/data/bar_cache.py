@@ -0,0 +1,101 @@
+"""This module contains the BarCache class."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from src.utils.logger import logger
+
+try:
+    import pyarrow  # noqa: F401  Parquet engine
+except ImportError:  # optional: without pyarrow, bars are only cached in memory
+    pyarrow = None
+
+
+class BarCache:
+    """
+    Price history DataFrames persisted as Parquet files, so fresh bars survive restarts.
+
+    Each fetch overwrites ``{root}/{ticker}/{interval}/{span}.parquet`` and is fresh while
+    the file's mtime is within the caller's TTL, so the cache holds one file per history.
+    Parquet keeps the column dtypes, so a loaded frame needs no further conversion.
+    Disabled when pyarrow is not installed.
+    """
+
+    def __init__(self, root: str = ".cache/bars") -> None:
+        """
+        Initialize the cache.
+
+        :param root: The directory the Parquet files are written under.
+        """
+        self.root = Path(root)
+
+    @property
+    def enabled(self) -> bool:
+        """True when a Parquet engine is available."""
+        return pyarrow is not None
+
+    def path(self, ticker: str, interval: str, span: str) -> Path:
+        """Return the cache file for a ticker's history."""
+        return self.root / ticker / interval / f"{span}.parquet"
+
+    def load(self, ticker: str, interval: str, span: str, ttl: float) -> Optional[Tuple[float, pd.DataFrame]]:
+        """
+        Return the cached history if it was stored less than ttl seconds ago.
+
+        :param ticker: The stock ticker.
+        :param interval: The interval of the data.
+        :param span: The span of the data.
+        :param ttl: Seconds a stored history stays fresh.
+        :return: The (age in seconds, DataFrame) pair, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+
+        path = self.path(ticker, interval, span)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age >= ttl:
+                return None
+            return age, pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Error reading cached bars from %s: %s", path, str(e))
+            return None
+
+    def store(self, ticker: str, interval: str, span: str, df: pd.DataFrame) -> None:
+        """
+        Write a fetched history to the cache.
+
+        :param ticker: The stock ticker.
+        :param interval: The interval of the data.
+        :param span: The span of the data.
+        :param df: The history to store.
+        """
+        if not self.enabled or df.empty:
+            return
+
+        path = self.path(ticker, interval, span)
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file unique to this writer, then rename, so neither a concurrent
+            # reader nor another bot process storing the same history sees a partial file
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{span}-", suffix=".tmp", delete=False) as tmp:
+                tmp_path = tmp.name
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            # Drop the per-day files older versions of the cache left behind
+            for stale in path.parent.glob(f"{span}-????????.parquet"):
+                stale.unlink(missing_ok=True)
+        except (OSError, ValueError) as e:
+            logger.warning("Error caching bars to %s: %s", path, str(e))
+        finally:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
@@ -1,11 +1,11 @@
 """This module contains the OrderResult class."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """Data class representing the result of a trading order."""
 
@@ -15,4 +15,4 @@ class OrderResult:
     details: Optional[Dict[str, Any]] = None
     amount: float = 0.0
     price: float = 0.0
-    timestamp: datetime = datetime.now(timezone.utc)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
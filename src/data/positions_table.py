@@ -0,0 +1,143 @@
+"""This module contains the PositionsTable class."""
+
+from dataclasses import fields
+from typing import Any, Dict, Iterator, List, MutableMapping
+
+import numpy as np
+
+from src.data.position import Position
+
+_FIELDS = tuple(field.name for field in fields(Position))
+
+
+def _column(name: str) -> property:
+    """Return a property exposing one Position field of every held position as a NumPy view."""
+    col = _FIELDS.index(name)
+
+    def getter(self: "PositionsTable") -> np.ndarray:
+        return self._columns[col, : len(self._tickers)]
+
+    return property(getter, doc=f"The {name} of every position, in slot order.")
+
+
+def _view_field(name: str) -> property:
+    """Return a property reading and writing one Position field in a PositionView's slot."""
+    col = _FIELDS.index(name)
+
+    def getter(self: "PositionView") -> float:
+        return float(self._table._columns[col, self._table._ticker_to_idx[self._ticker]])
+
+    def setter(self: "PositionView", value: float) -> None:
+        self._table._columns[col, self._table._ticker_to_idx[self._ticker]] = value
+
+    return property(getter, setter, doc=f"The position's {name}, stored in the table.")
+
+
+class PositionView(Position):
+    """
+    A Position whose fields live in a PositionsTable row.
+
+    Reading a field reads the table and assigning one writes it back, so
+    ``table[ticker].highest_price = x`` updates the table. The view follows its ticker
+    when slots are moved, and raises KeyError once the ticker is removed.
+    """
+
+    __slots__ = ("_table", "_ticker")
+
+    def __init__(self, table: "PositionsTable", ticker: str) -> None:
+        """
+        Initialize a view of one position.
+
+        :param table: The table holding the position.
+        :param ticker: The ticker of the position.
+        """
+        self._table = table
+        self._ticker = ticker
+
+    def snapshot(self) -> Position:
+        """Return a detached copy of the position."""
+        return Position(*(getattr(self, name) for name in _FIELDS))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _FIELDS)
+
+    __hash__ = None
+
+
+for _name in _FIELDS:
+    setattr(PositionView, _name, _view_field(_name))
+
+
+class PositionsTable(MutableMapping[str, Position]):
+    """
+    Positions keyed by ticker, stored as one NumPy array per Position field.
+
+    Behaves like a ``Dict[str, Position]``: indexing returns a PositionView that reads
+    and writes the columns, and assigning a Position copies it into them. Aggregates read the columns
+    directly, e.g. ``table.equity.sum()``.
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self) -> None:
+        """Initialize an empty PositionsTable."""
+        self._ticker_to_idx: Dict[str, int] = {}
+        self._tickers: List[str] = []
+        # One contiguous array per Position field; slot ``i`` of each belongs to ticker ``i``
+        self._columns = np.zeros((len(_FIELDS), self._INITIAL_CAPACITY))
+
+    quantity = _column("quantity")
+    average_buy_price = _column("average_buy_price")
+    current_price = _column("current_price")
+    equity = _column("equity")
+    unrealized_pl = _column("unrealized_pl")
+    unrealized_pl_pct = _column("unrealized_pl_pct")
+    highest_price = _column("highest_price")
+
+    @property
+    def tickers(self) -> List[str]:
+        """The tickers held, in slot order."""
+        return list(self._tickers)
+
+    def __getitem__(self, ticker: str) -> PositionView:
+        if ticker not in self._ticker_to_idx:
+            raise KeyError(ticker)
+        return PositionView(self, ticker)
+
+    def __setitem__(self, ticker: str, position: Position) -> None:
+        idx = self._ticker_to_idx.get(ticker)
+        if idx is None:
+            idx = len(self._tickers)
+            if idx == self._columns.shape[1]:
+                self._grow()
+            self._ticker_to_idx[ticker] = idx
+            self._tickers.append(ticker)
+        self._columns[:, idx] = [getattr(position, name) for name in _FIELDS]
+
+    def __delitem__(self, ticker: str) -> None:
+        # Move the last position into the freed slot so the slots stay contiguous
+        idx = self._ticker_to_idx.pop(ticker)
+        last = len(self._tickers) - 1
+        if idx != last:
+            moved = self._tickers[last]
+            self._columns[:, idx] = self._columns[:, last]
+            self._tickers[idx] = moved
+            self._ticker_to_idx[moved] = idx
+        self._tickers.pop()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._tickers))
+
+    def __len__(self) -> int:
+        return len(self._tickers)
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self._ticker_to_idx
+
+    def _grow(self) -> None:
+        """Double the slot capacity, keeping the positions recorded so far."""
+        grown = np.zeros((len(_FIELDS), 2 * self._columns.shape[1]))
+        grown[:, : len(self._tickers)] = self._columns[:, : len(self._tickers)]
+        self._columns = grown
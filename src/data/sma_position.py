@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.data.position import Position
 
 
-@dataclass
+@dataclass(slots=True)
 class SMAPosition(Position):
     """Data class representing a trading position with SMA-specific metrics."""
 
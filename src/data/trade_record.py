@@ -0,0 +1,14 @@
+"""This module contains the TradeRecord class."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class TradeRecord:
+    """Data class representing a completed trade in a bot's trade history."""
+
+    timestamp_ns: int
+    profit_loss: float
+    side: str
+    price: float
+    quantity: float
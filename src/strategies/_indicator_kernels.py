@@ -0,0 +1,256 @@
+"""This module contains the compiled kernels behind the technical indicator signals.
+
+The signals only ever read the latest indicator value, so each kernel walks the
+close array once and returns scalars instead of building intermediate Series.
+The kernels take float32 or float64 arrays and always accumulate in float64.
+Numba is optional: without it the kernels run as plain Python loops.
+"""
+
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: fall back to plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def macd_last(close, fast_period, slow_period, signal_period):
+    """
+    Return the latest (macd, signal_line) pair for the close series.
+
+    Runs the fast EMA, slow EMA and signal EMA recurrences in a single pass, with the
+    same seeding and missing-value handling as pandas ``ewm(span=..., adjust=False)``:
+    the EMAs start at the first finite close, a non-finite close leaves them unchanged,
+    and the weight of the previous value keeps decaying across such gaps.
+    """
+    n = close.shape[0]
+    first = 0
+    while first < n and not np.isfinite(close[first]):
+        first += 1
+    if first == n:
+        return np.nan, np.nan
+
+    alpha_fast = 2.0 / (fast_period + 1.0)
+    alpha_slow = 2.0 / (slow_period + 1.0)
+    alpha_signal = 2.0 / (signal_period + 1.0)
+
+    ema_fast = np.float64(close[first])
+    ema_slow = ema_fast
+    # Weight of the previous EMA value, decayed once per bar since the last finite close
+    weight_fast = 1.0
+    weight_slow = 1.0
+    macd = 0.0
+    signal_line = 0.0
+    for i in range(first + 1, n):
+        price = np.float64(close[i])
+        weight_fast *= 1.0 - alpha_fast
+        weight_slow *= 1.0 - alpha_slow
+        if np.isfinite(price):
+            if ema_fast != price:
+                ema_fast = (weight_fast * ema_fast + alpha_fast * price) / (weight_fast + alpha_fast)
+            if ema_slow != price:
+                ema_slow = (weight_slow * ema_slow + alpha_slow * price) / (weight_slow + alpha_slow)
+            weight_fast = 1.0
+            weight_slow = 1.0
+            macd = ema_fast - ema_slow
+        # The MACD line carries its last value through a gap, so the signal EMA still steps
+        signal_line += alpha_signal * (macd - signal_line)
+
+    return macd, signal_line
+
+
+@njit(cache=True)
+def rsi_last(close, period):
+    """
+    Return the latest RSI over the last ``period`` price changes.
+
+    Uses the simple-average form the RSI signal has always used: the mean gain and mean
+    loss over the window, with a missing change (the first bar, or a NaN close)
+    counting as zero.
+    """
+    n = close.shape[0]
+    if period <= 0 or n < period:
+        return np.nan
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(max(n - period, 1), n):
+        delta = np.float64(close[i]) - close[i - 1]
+        if delta > 0:
+            gain += delta
+        elif delta < 0:
+            loss -= delta
+
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+@njit(cache=True)
+def _welford_last(arr, period):
+    """Return the (mean, sum of squared deviations) of the last ``period`` elements."""
+    n = arr.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    for k in range(period):
+        x = np.float64(arr[n - period + k])
+        d = x - mean
+        mean += d / (k + 1)
+        m2 += d * (x - mean)
+    return mean, m2
+
+
+@njit(cache=True)
+def sma_std_mom_vol_last(close, period, momentum_lookback):
+    """
+    Return the latest (sma, std, momentum, volatility) for the close series.
+
+    Matches the pandas chain the SMA bot used to build: ``rolling(period).mean()``,
+    ``rolling(period, min_periods=1).std()``, ``pct_change(momentum_lookback)`` and the
+    annualised ``rolling(period).std()`` of the log returns. The means and variances over
+    the last ``period`` elements are accumulated with Welford's update.
+    """
+    n = close.shape[0]
+    if period <= 0 or n < period:
+        return np.nan, np.nan, np.nan, np.nan
+
+    mean, m2 = _welford_last(close, period)
+    std = np.sqrt(m2 / (period - 1)) if period > 1 else np.nan
+
+    momentum = np.nan
+    if 0 < momentum_lookback < n:
+        momentum = np.float64(close[n - 1]) / close[n - 1 - momentum_lookback] - 1.0
+
+    volatility = np.nan
+    if 1 < period < n:
+        # Log returns as differences of logs, carrying the previous log forward so each
+        # close is logged once and no return array is materialised
+        lr_mean = 0.0
+        lr_m2 = 0.0
+        prev_log = np.log(np.float64(close[n - period - 1]))
+        for k in range(period):
+            cur_log = np.log(np.float64(close[n - period + k]))
+            x = cur_log - prev_log
+            prev_log = cur_log
+            d = x - lr_mean
+            lr_mean += d / (k + 1)
+            lr_m2 += d * (x - lr_mean)
+        volatility = np.sqrt(lr_m2 / (period - 1) * 252.0)
+
+    return mean, std, momentum, volatility
+
+
+@functools.lru_cache(maxsize=None)
+def make_sma_std_mom_vol_last(period, momentum_lookback):
+    """
+    Return ``sma_std_mom_vol_last`` specialised to fixed periods, taking only ``close``.
+
+    The periods are captured as compile-time constants, so the window loops compile with
+    a known trip count. One specialisation is built per (period, momentum_lookback).
+    """
+
+    @njit(cache=True)
+    def kernel(close):
+        return sma_std_mom_vol_last(close, period, momentum_lookback)
+
+    return kernel
+
+
+@njit(parallel=True, cache=True)
+def batch_sma_last(closes, lengths, short_period, long_period):
+    """
+    Return the SMA crossover signal (-1.0, 0.0 or 1.0) for every row of a close matrix.
+
+    Row ``i`` holds one ticker's latest closes right-aligned, with ``lengths[i]`` the
+    number of bars that ticker actually has; rows shorter than the long window get 0.0,
+    as do windows containing a NaN. Rows are independent and are spread across threads.
+    """
+    n_rows, n_bars = closes.shape
+    out = np.zeros(n_rows)
+    for i in prange(n_rows):
+        if lengths[i] < long_period:
+            continue
+
+        short_sum = 0.0
+        long_sum = 0.0
+        for j in range(n_bars - long_period, n_bars):
+            long_sum += closes[i, j]
+            if j >= n_bars - short_period:
+                short_sum += closes[i, j]
+
+        diff = short_sum / short_period - long_sum / long_period
+        if diff > 0.0:
+            out[i] = 1.0
+        elif diff < 0.0:
+            out[i] = -1.0
+    return out
+
+
+@njit(cache=True, error_model="numpy")
+def vwap_bands_last(high, low, close, volume, window):
+    """
+    Return the latest (vwap, std_dev, upper_band, lower_band, volume_ratio) in one sweep.
+
+    The VWAP is cumulative over typical price ``(high + low + close) / 3``; std_dev is the
+    sample standard deviation of its last ``window`` values and volume_ratio the latest
+    volume over its ``window`` mean. Missing bars are skipped by the running sums but
+    give a NaN VWAP at their own position, as pandas' ``cumsum`` does.
+    """
+    n = close.shape[0]
+    tail_start = n - window if window <= n else n
+
+    cum_price_volume = 0.0
+    cum_volume = 0.0
+    vwap = np.nan
+    mean = 0.0
+    m2 = 0.0
+    volume_sum = 0.0
+    for i in range(n):
+        v = np.float64(volume[i])
+        price_volume = (np.float64(high[i]) + low[i] + close[i]) / 3.0 * v
+        if not np.isnan(price_volume):
+            cum_price_volume += price_volume
+        if not np.isnan(v):
+            cum_volume += v
+        vwap = np.nan if np.isnan(price_volume) or np.isnan(v) else cum_price_volume / cum_volume
+
+        if i >= tail_start:
+            k = i - tail_start
+            d = vwap - mean
+            mean += d / (k + 1)
+            m2 += d * (vwap - mean)
+            volume_sum += v
+
+    std = np.nan
+    volume_ratio = np.nan
+    if tail_start < n:
+        if window > 1:
+            std = np.sqrt(m2 / (window - 1))
+        volume_ratio = np.float64(volume[n - 1]) / (volume_sum / window)
+
+    return vwap, std, vwap + 2.0 * std, vwap - 2.0 * std, volume_ratio
+
+
+@functools.lru_cache(maxsize=None)
+def make_vwap_bands_last(window):
+    """
+    Return ``vwap_bands_last`` specialised to a fixed window, taking only the price columns.
+
+    The window is captured as a compile-time constant, like ``make_sma_std_mom_vol_last``.
+    One specialisation is built per window.
+    """
+
+    @njit(cache=True, error_model="numpy")
+    def kernel(high, low, close, volume):
+        return vwap_bands_last(high, low, close, volume, window)
+
+    return kernel
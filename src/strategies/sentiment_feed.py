@@ -0,0 +1,120 @@
+"""This module contains the SentimentFeed class."""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Deque, Tuple
+
+import numpy as np
+
+from src.api.ticker_to_company import TICKER_TO_COMPANY
+from src.core.config import SentimentAnalysisConfig
+from src.utils.credentials import TwitterCredentials
+from src.utils.logger import logger
+
+# Seconds between searches for new tweets
+SENTIMENT_REFRESH_INTERVAL = 300
+
+# Links and @mentions/#hashtags/$cashtags are stripped before scoring a tweet
+_URL_RE = re.compile(r"http\S+|www\S+|https\S+", re.MULTILINE)
+_TAG_RE = re.compile(r"[@#$]\w+")
+
+
+class SentimentFeed:
+    """
+    Keeps the sentiment of a ticker's recent tweets up to date from a background thread.
+
+    The thread searches Twitter every SENTIMENT_REFRESH_INTERVAL seconds, scores the new
+    tweets and keeps the latest ``max_tweets_analyze`` (created_at, score) pairs, so
+    reading the sentiment never waits on the Twitter API.
+    """
+
+    def __init__(self, ticker: str, config: SentimentAnalysisConfig, credentials: TwitterCredentials) -> None:
+        """
+        Initialize the feed and start its background thread.
+
+        :param ticker: The stock ticker to follow.
+        :param config: The sentiment analysis configuration.
+        :param credentials: The Twitter API credentials.
+        """
+        self.ticker = ticker
+        self.config = config
+        self._credentials = credentials
+        self._scores: Deque[Tuple[float, float]] = deque(maxlen=config.max_tweets_analyze)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"sentiment-{ticker}", daemon=True)
+        self._thread.start()
+
+    def recent_scores(self) -> np.ndarray:
+        """
+        Return the scores of the tweets created within the configured lookback window.
+
+        :return: The matching scores, oldest first.
+        """
+        cutoff = time.time() - self.config.sentiment_lookback_days * 86400
+        with self._lock:
+            return np.fromiter((score for created_at, score in self._scores if created_at >= cutoff), dtype=np.float64)
+
+    def is_alive(self) -> bool:
+        """Return True while the background thread is running."""
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Search for and score new tweets until stopped."""
+        company_name = TICKER_TO_COMPANY.get(self.ticker, self.ticker)
+        query = f"({company_name} OR ${self.ticker}) lang:en -filter:retweets"
+        since_id = None
+        api = None
+
+        while not self._stop.is_set():
+            # Any failure, including in the setup below, is logged and retried on the next
+            # refresh, so the feed never dies silently and leaves the sentiment neutral
+            try:
+                if api is None:
+                    # The sentiment stack (tweepy, TextBlob/NLTK, VADER) is slow to import and
+                    # sentiment is off by default, so only pay for it when a feed is started.
+                    import tweepy
+                    from textblob import TextBlob
+                    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+                    vader_analyzer = SentimentIntensityAnalyzer()
+                    auth = tweepy.AppAuthHandler(self._credentials.consumer_key, self._credentials.consumer_secret)
+                    api = tweepy.API(auth, wait_on_rate_limit=True)
+
+                tweets = tweepy.Cursor(
+                    api.search_tweets,
+                    q=query,
+                    lang="en",
+                    result_type="mixed",
+                    tweet_mode="extended",
+                    since_id=since_id,
+                ).items(self.config.max_tweets_analyze)
+
+                scored = []
+                newest_id = since_id
+                for tweet in tweets:
+                    clean_text = _TAG_RE.sub("", _URL_RE.sub("", tweet.full_text))
+
+                    vader_score = vader_analyzer.polarity_scores(clean_text)["compound"]
+                    textblob_score = TextBlob(clean_text).sentiment.polarity
+
+                    # Combine scores
+                    scored.append((tweet.created_at.timestamp(), (vader_score * 0.7) + (textblob_score * 0.3)))
+                    newest_id = max(newest_id or 0, tweet.id)
+
+                # Search results arrive newest first
+                with self._lock:
+                    self._scores.extend(sorted(scored))
+                since_id = newest_id
+
+            except Exception:
+                logger.exception("Error in sentiment analysis for %s", self.ticker)
+
+            self._stop.wait(SENTIMENT_REFRESH_INTERVAL)
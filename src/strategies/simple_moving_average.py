@@ -9,6 +9,7 @@ import pandas as pd
 from src.core.base_trade_bot import TradeBot
 from src.core.config import StrategyType, TradingConfig, OrderType
 from src.data.order_result import OrderResult
+from src.strategies._indicator_kernels import make_sma_std_mom_vol_last
 from src.utils.logger import logger
 
 
@@ -36,6 +37,7 @@ class TradeBotSimpleMovingAverage(TradeBot):
         super().__init__(config=config if config else TradingConfig())
         self.strategy_type = StrategyType.SMA_CROSSOVER
         self._validate_sma_config()
+        self._warm_up_indicator_kernels()
 
     def _validate_sma_config(self) -> None:
         """Validate SMA-specific configuration parameters."""
@@ -45,6 +47,13 @@ class TradeBotSimpleMovingAverage(TradeBot):
         if self.config.technical_indicators.momentum_lookback_period <= 0:
             raise ValueError("Momentum lookback period must be positive")
 
+    def _warm_up_indicator_kernels(self) -> None:
+        """Compile the indicator kernels for the configured periods so the first tick pays no JIT cost."""
+        indicators = self.config.technical_indicators
+        sample = np.ones(indicators.sma_long_period + 1, dtype=np.float32)
+        for period in (indicators.sma_short_period, indicators.sma_long_period):
+            make_sma_std_mom_vol_last(period, indicators.momentum_lookback_period)(sample)
+
     def calculate_technical_indicators(self, df: pd.DataFrame, period: int) -> TechnicalIndicators:
         """
         Calculate technical indicators for the given period.
@@ -58,32 +67,22 @@ class TradeBotSimpleMovingAverage(TradeBot):
             return {"sma": 0.0, "std": 0.0, "momentum": 0.0, "volatility": 0.0}
 
         try:
-            df = df.copy()
-            df["close_price"] = pd.to_numeric(df["close_price"], errors="coerce")
-
-            # Handle NaN values
-            df = df.dropna(subset=["close_price"])
+            # Coerce to numbers and drop missing bars without touching the caller's DataFrame
+            close = pd.to_numeric(df["close_price"], errors="coerce").dropna().to_numpy(copy=False)
 
-            if len(df) < period:
+            if len(close) < period:
                 logger.warning("Insufficient data points for period %s", period)
                 return {"sma": 0.0, "std": 0.0, "momentum": 0.0, "volatility": 0.0}
 
-            # Calculate SMA and Standard Deviation
-            df["SMA"] = df["close_price"].rolling(window=period, min_periods=1).mean()
-            df["STD"] = df["close_price"].rolling(window=period, min_periods=1).std()
-
-            # Calculate Momentum (rate of change)
-            df["momentum"] = df["close_price"].pct_change(self.config.technical_indicators.momentum_lookback_period)
-
-            # Calculate Historical Volatility
-            df["log_return"] = np.log(df["close_price"] / df["close_price"].shift(1))
-            df["volatility"] = df["log_return"].rolling(window=period).std() * np.sqrt(252)
+            # SMA, standard deviation, momentum and annualised volatility of the latest window
+            kernel = make_sma_std_mom_vol_last(period, self.config.technical_indicators.momentum_lookback_period)
+            sma, std, momentum, volatility = kernel(close)
 
             return {
-                "sma": round(df["SMA"].iloc[-1], 4),
-                "std": round(df["STD"].iloc[-1], 4),
-                "momentum": round(df["momentum"].iloc[-1], 4),
-                "volatility": round(df["volatility"].iloc[-1], 4),
+                "sma": round(sma, 4),
+                "std": round(std, 4),
+                "momentum": round(momentum, 4),
+                "volatility": round(volatility, 4),
             }
 
         except (pd.errors.EmptyDataError, KeyError, ValueError) as e:
@@ -156,18 +155,29 @@ class TradeBotSimpleMovingAverage(TradeBot):
         :param ticker: Stock ticker symbol
         :return: OrderType recommendation
         """
+        return self._evaluate_ticker(ticker)[0]
+
+    def _evaluate_ticker(self, ticker: str) -> Tuple[Optional[OrderType], float]:
+        """
+        Fetch the price history once and derive both the recommendation and the signal strength.
+
+        :param ticker: Stock ticker symbol
+        :return: Tuple of (OrderType recommendation, signal strength)
+        """
         try:
             if not ticker:
-                return None
+                return None, 0.0
 
             # Get historical data and current market conditions
-            stock_history_df = self.get_stock_history_dataframe(ticker, interval="5minute", span="day")
+            stock_history_df = self.resample_to_decision_freq(
+                self.get_stock_history_dataframe(ticker, interval="5minute", span="day")
+            )
             current_price = self.get_current_market_price(ticker)
             position = self.get_current_positions().get(ticker)
 
             if position and self.check_risk_management(current_price, position):
                 logger.info("Risk management triggered for %s", ticker)
-                return OrderType.SELL_RECOMMENDATION
+                return OrderType.SELL_RECOMMENDATION, 0.0
 
             short_term = self.calculate_technical_indicators(
                 stock_history_df,
@@ -191,15 +201,15 @@ class TradeBotSimpleMovingAverage(TradeBot):
             )
 
             if signal_strength > threshold and momentum_signal:
-                return OrderType.BUY_RECOMMENDATION
+                return OrderType.BUY_RECOMMENDATION, signal_strength
             if signal_strength < -threshold or (signal_strength < 0 and not momentum_signal):
-                return OrderType.SELL_RECOMMENDATION
+                return OrderType.SELL_RECOMMENDATION, signal_strength
 
-            return OrderType.HOLD_RECOMMENDATION
+            return OrderType.HOLD_RECOMMENDATION, signal_strength
 
         except (pd.errors.EmptyDataError, KeyError, ValueError) as e:
             logger.error("Error generating order recommendation: %s", str(e))
-            return OrderType.HOLD_RECOMMENDATION
+            return OrderType.HOLD_RECOMMENDATION, 0.0
 
     def execute_trade(self, ticker: str) -> OrderResult:
         """
@@ -212,21 +222,9 @@ class TradeBotSimpleMovingAverage(TradeBot):
             if not self.config.should_trade_now(datetime.now(timezone.utc)):
                 return OrderResult(success=False, error_message="Outside trading hours", amount=0.0)
 
-            recommendation = self.make_order_recommendation(ticker)
+            recommendation, signal_strength = self._evaluate_ticker(ticker)
 
             if recommendation == OrderType.BUY_RECOMMENDATION:
-                stock_history_df = self.get_stock_history_dataframe(ticker, interval="5minute", span="day")
-                short_term = self.calculate_technical_indicators(
-                    stock_history_df,
-                    self.config.technical_indicators.sma_short_period,
-                )
-                long_term = self.calculate_technical_indicators(
-                    stock_history_df,
-                    self.config.technical_indicators.sma_long_period,
-                )
-                _,
-                signal_strength,
-                _ = self.analyze_market_conditions(short_term, long_term)
                 position_size = self.calculate_position_size(ticker, signal_strength)
                 return self.place_order(ticker, OrderType.BUY_RECOMMENDATION, position_size)
 
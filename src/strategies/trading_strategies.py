@@ -1,35 +1,147 @@
 """This module contains the trading strategies for the trading bot."""
 
-import re
+import functools
+import threading
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import tweepy
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-from src.api.ticker_to_company import TICKER_TO_COMPANY
+from src.strategies._indicator_kernels import batch_sma_last, macd_last, rsi_last
+from src.strategies.sentiment_feed import SentimentFeed
 from src.core.config import SentimentAnalysisConfig, TechnicalIndicatorsConfig
 from src.utils.credentials import TwitterCredentials
+from src.utils.logger import logger
+
+# One background feed per ticker, started on the first sentiment request
+_SENTIMENT_FEEDS: Dict[str, SentimentFeed] = {}
+_SENTIMENT_FEEDS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _twitter_credentials() -> Optional[TwitterCredentials]:
+    """Load the Twitter credentials once per process; None when they are not set."""
+    twitter_credentials = TwitterCredentials()
+    if twitter_credentials.empty_credentials:
+        logger.warning("Twitter credentials are not set. Skipping sentiment analysis.")
+        return None
+    return twitter_credentials
+
+
+def _close(df: pd.DataFrame) -> np.ndarray:
+    """Return the close column as an array in its stored dtype, without copying."""
+    return df["close"].to_numpy(copy=False)
+
+
+def _sma_last(close: np.ndarray, config: TechnicalIndicatorsConfig) -> Tuple[float, float]:
+    """Return the latest (short, long) SMA pair, NaN when there is less data than the long window."""
+    # Only the latest value of each average matters, so average the tail windows
+    # directly rather than rolling over the whole series.
+    if len(close) < config.sma_long_period:
+        return np.nan, np.nan
+    return (
+        close[-config.sma_short_period :].mean(dtype=np.float64),
+        close[-config.sma_long_period :].mean(dtype=np.float64),
+    )
+
+
+def _vwap_last(close: np.ndarray, volume: np.ndarray) -> float:
+    """Return the latest cumulative VWAP, NaN when the latest bar or the total volume is missing."""
+    # The latest cumulative VWAP is just total price*volume over total volume,
+    # summed in float64 whatever the dtype of the bars.
+    price_volume = close * volume
+    if np.isnan(price_volume[-1]) or np.isnan(volume[-1]):
+        # a missing latest bar left the cumulative sums NaN too
+        return np.nan
+    total_price_volume = price_volume.sum(dtype=np.float64)
+    total_volume = volume.sum(dtype=np.float64)
+    if np.isnan(total_price_volume) or np.isnan(total_volume):
+        # skip missing earlier bars, as the cumulative sums did
+        total_price_volume = np.nansum(price_volume, dtype=np.float64)
+        total_volume = np.nansum(volume, dtype=np.float64)
+    if total_volume == 0:
+        # no traded volume (illiquid or pre-market bars): undefined, so the signal stays neutral
+        return np.nan
+    return float(total_price_volume / total_volume)
+
+
+def _macd_last(close: np.ndarray, config: TechnicalIndicatorsConfig) -> Tuple[float, float]:
+    """Return the latest (macd, signal_line) pair."""
+    return macd_last(close, config.macd_fast_period, config.macd_slow_period, config.macd_signal_period)
+
+
+def precompute_indicators(df: pd.DataFrame, config: TechnicalIndicatorsConfig) -> Dict[str, float]:
+    """
+    Compute the latest value of every technical indicator once per bar.
 
-
-def calculate_sma_signal(df: pd.DataFrame, config: TechnicalIndicatorsConfig) -> float:
+    The signal functions accept the result so that evaluating several strategies on the
+    same bar does not walk the price history once per strategy. An empty frame gives NaN
+    indicators, which every signal treats as neutral.
+    """
+    if df.empty:
+        return dict.fromkeys(["close", "sma_short", "sma_long", "vwap", "rsi", "macd", "macd_signal"], np.nan)
+
+    close = _close(df)
+    volume = df["volume"].to_numpy(copy=False)
+    sma_short, sma_long = _sma_last(close, config)
+    macd, macd_signal = _macd_last(close, config)
+
+    return {
+        "close": close[-1],
+        "sma_short": sma_short,
+        "sma_long": sma_long,
+        "vwap": _vwap_last(close, volume),
+        "rsi": rsi_last(close, config.rsi_period),
+        "macd": macd,
+        "macd_signal": macd_signal,
+    }
+
+
+def calculate_sma_signal(
+    df: pd.DataFrame, config: TechnicalIndicatorsConfig, indicators: Optional[Dict[str, float]] = None
+) -> float:
     """Calculate SMA crossover signal."""
-    short_sma = df["close"].rolling(window=config.sma_short_period).mean()
-    long_sma = df["close"].rolling(window=config.sma_long_period).mean()
+    if indicators is None:
+        short_sma, long_sma = _sma_last(_close(df), config)
+    else:
+        short_sma, long_sma = indicators["sma_short"], indicators["sma_long"]
+    return float(np.sign(np.nan_to_num(short_sma - long_sma)))
 
-    if short_sma.iloc[-1] > long_sma.iloc[-1]:
-        return 1.0
-    if short_sma.iloc[-1] < long_sma.iloc[-1]:
-        return -1.0
-    return 0.0
 
+def calculate_sma_signals_batch(closes: Dict[str, np.ndarray], config: TechnicalIndicatorsConfig) -> Dict[str, float]:
+    """
+    Calculate the SMA crossover signal for many tickers in one parallel sweep.
 
-def calculate_vwap_signal(df: pd.DataFrame, config: TechnicalIndicatorsConfig) -> float:
+    :param closes: Close prices per ticker, oldest first.
+    :return: The same values calculate_sma_signal gives, keyed by ticker.
+    """
+    tickers = list(closes)
+    if not tickers:
+        return {}
+
+    # Only the long window is read, so the matrix holds just the last long_period bars
+    width = config.sma_long_period
+    lengths = np.fromiter((len(closes[ticker]) for ticker in tickers), dtype=np.int64, count=len(tickers))
+    matrix = np.full((len(tickers), width), np.nan, dtype=np.float32)
+    for row, ticker in enumerate(tickers):
+        tail = np.asarray(closes[ticker])[-width:]
+        if len(tail):
+            matrix[row, -len(tail) :] = tail
+
+    signals = batch_sma_last(matrix, lengths, config.sma_short_period, config.sma_long_period)
+    return dict(zip(tickers, signals.tolist()))
+
+
+def calculate_vwap_signal(
+    df: pd.DataFrame, config: TechnicalIndicatorsConfig, indicators: Optional[Dict[str, float]] = None
+) -> float:
     """Calculate VWAP signal."""
-    df["vwap"] = (df["close"] * df["volume"]).cumsum() / df["volume"].cumsum()
-    current_price = df["close"].iloc[-1]
-    vwap = df["vwap"].iloc[-1]
+    if indicators is None:
+        close = _close(df)
+        vwap = _vwap_last(close, df["volume"].to_numpy(copy=False))
+        current_price = close[-1]
+    else:
+        vwap, current_price = indicators["vwap"], indicators["close"]
 
     threshold = config.vwap_threshold
     if current_price > vwap * (1 + threshold):
@@ -39,15 +151,11 @@ def calculate_vwap_signal(df: pd.DataFrame, config: TechnicalIndicatorsConfig) -
     return 0.0
 
 
-def calculate_rsi_signal(df: pd.DataFrame, config: TechnicalIndicatorsConfig) -> float:
+def calculate_rsi_signal(
+    df: pd.DataFrame, config: TechnicalIndicatorsConfig, indicators: Optional[Dict[str, float]] = None
+) -> float:
     """Calculate RSI signal."""
-    delta = df["close"].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=config.rsi_period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=config.rsi_period).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-
-    current_rsi = rsi.iloc[-1]
+    current_rsi = rsi_last(_close(df), config.rsi_period) if indicators is None else indicators["rsi"]
     if current_rsi < config.rsi_oversold:
         return 1.0
     if current_rsi > config.rsi_overbought:
@@ -55,18 +163,15 @@ def calculate_rsi_signal(df: pd.DataFrame, config: TechnicalIndicatorsConfig) ->
     return 0.0
 
 
-def calculate_macd_signal(df: pd.DataFrame, config: TechnicalIndicatorsConfig) -> float:
+def calculate_macd_signal(
+    df: pd.DataFrame, config: TechnicalIndicatorsConfig, indicators: Optional[Dict[str, float]] = None
+) -> float:
     """Calculate MACD signal."""
-    short_ema = df["close"].ewm(span=config.macd_short_period, adjust=False).mean()
-    long_ema = df["close"].ewm(span=config.macd_long_period, adjust=False).mean()
-    macd = short_ema - long_ema
-    signal_line = macd.ewm(span=config.macd_signal_period, adjust=False).mean()
-
-    if macd.iloc[-1] > signal_line.iloc[-1]:
-        return 1.0
-    if macd.iloc[-1] < signal_line.iloc[-1]:
-        return -1.0
-    return 0.0
+    if indicators is None:
+        macd, signal_line = _macd_last(_close(df), config)
+    else:
+        macd, signal_line = indicators["macd"], indicators["macd_signal"]
+    return float(np.sign(np.nan_to_num(macd - signal_line)))
 
 
 def calculate_volatility(df: pd.DataFrame) -> float:
@@ -74,63 +179,43 @@ def calculate_volatility(df: pd.DataFrame) -> float:
     if df.empty:
         return 0.0
 
-    df["returns"] = df["close_price"].astype(float).pct_change()
-    return df["returns"].std() * np.sqrt(252)
+    # Daily returns as a local array; the caller's DataFrame is left untouched.
+    close = df["close_price"].to_numpy(dtype=np.float64)
+    returns = close[1:] / close[:-1] - 1.0
+    returns = returns[~np.isnan(returns)]
+    if len(returns) < 2:
+        return np.nan
+    return float(returns.std(ddof=1) * np.sqrt(252))
 
 
 def calculate_sentiment_signal(ticker: str, config: SentimentAnalysisConfig) -> float:
     """
     Calculates a trading signal based on Twitter sentiment.
     Returns a float between -1.0 (strong sell) and 1.0 (strong buy).
+
+    Tweets are fetched and scored by a background SentimentFeed per ticker; this only
+    averages the scores collected so far, so it stays neutral until enough have arrived.
     """
     if not config.enable_sentiment:
         return 0.0
 
-    try:
-        twitter_credentials = TwitterCredentials()
-        if twitter_credentials.empty_credentials:
-            print("Twitter credentials are not set. Skipping sentiment analysis.")
-            return 0.0
-
-        auth = tweepy.AppAuthHandler(twitter_credentials.consumer_key, twitter_credentials.consumer_secret)
-        api = tweepy.API(auth, wait_on_rate_limit=True)
-
-        company_name = TICKER_TO_COMPANY.get(ticker, ticker)
-        query = f"({company_name} OR ${ticker}) lang:en -filter:retweets"
-
-        tweets = tweepy.Cursor(
-            api.search_tweets,
-            q=query,
-            lang="en",
-            result_type="mixed",
-            tweet_mode="extended",
-        ).items(config.max_tweets_analyze)
-
-        sentiment_scores = []
-        vader_analyzer = SentimentIntensityAnalyzer()
-
-        for tweet in tweets:
-            clean_text = re.sub(r"http\S+|www\S+|https\S+", "", tweet.full_text, flags=re.MULTILINE)
-            clean_text = re.sub(r"[@#$]\w+", "", clean_text)
-
-            vader_score = vader_analyzer.polarity_scores(clean_text)["compound"]
-            textblob_score = TextBlob(clean_text).sentiment.polarity
-
-            # Combine scores
-            combined_score = (vader_score * 0.7) + (textblob_score * 0.3)
-            sentiment_scores.append(combined_score)
-
-        if not sentiment_scores or len(sentiment_scores) < config.min_sentiment_samples:
-            return 0.0
-
-        avg_sentiment = np.mean(sentiment_scores)
-
-        if avg_sentiment > config.sentiment_threshold_buy:
-            return 1.0
-        if avg_sentiment < config.sentiment_threshold_sell:
-            return -1.0
+    with _SENTIMENT_FEEDS_LOCK:
+        feed = _SENTIMENT_FEEDS.get(ticker)
+        # A feed whose thread has exited is replaced rather than read forever
+        if feed is None or not feed.is_alive():
+            twitter_credentials = _twitter_credentials()
+            if twitter_credentials is None:
+                return 0.0
+            feed = _SENTIMENT_FEEDS[ticker] = SentimentFeed(ticker, config, twitter_credentials)
+
+    sentiment_scores = feed.recent_scores()
+    if len(sentiment_scores) < config.min_sentiment_samples:
         return 0.0
 
-    except tweepy.TweepyException as e:
-        print(f"Error in sentiment analysis for {ticker}: {e}")
-        return 0.0
+    avg_sentiment = np.mean(sentiment_scores)
+
+    if avg_sentiment > config.sentiment_threshold_buy:
+        return 1.0
+    if avg_sentiment < config.sentiment_threshold_sell:
+        return -1.0
+    return 0.0
@@ -1,18 +1,28 @@
 """This module contains the TradeBotVWAP class."""
 
-from dataclasses import dataclass
+import time
+import warnings
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Deque, Dict, List, Optional, Tuple, TypedDict
 
 import numpy as np
 import pandas as pd
 
 from src.core.base_trade_bot import TradeBot
 from src.core.config import OrderType, TradingConfig
+from src.data.bar_cache import BarCache
 from src.data.order_result import OrderResult
 from src.data.position import Position
+from src.data.positions_table import PositionsTable
+from src.data.trade_record import TradeRecord
+from src.strategies._indicator_kernels import make_vwap_bands_last
 from src.utils.logger import logger
 
+# Below this many bars the NumPy path is cheaper than calling the compiled kernel
+_VWAP_KERNEL_MIN_BARS = 200
+
 
 class PerformanceSummary(TypedDict):
     """A dictionary representing the performance summary."""
@@ -26,7 +36,7 @@ class PerformanceSummary(TypedDict):
     last_updated: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VWAPMetrics:
     """Container for VWAP-related metrics"""
 
@@ -37,11 +47,49 @@ class VWAPMetrics:
     volume_ratio: float
 
 
+def _cumsum_skipna(values: np.ndarray) -> np.ndarray:
+    """Float64 cumulative sum that skips NaNs and keeps them in place, like ``Series.cumsum``."""
+    missing = np.isnan(values)
+    if not missing.any():
+        return np.cumsum(values, dtype=np.float64)
+    cumulative = np.nancumsum(values, dtype=np.float64)
+    cumulative[missing] = np.nan
+    return cumulative
+
+
+@dataclass(slots=True)
+class _VWAPState:
+    """Running VWAP sums for one (ticker, interval), covering the bars up to last_bar."""
+
+    first_bar: Any
+    window: int
+    last_bar: Any = None
+    cum_price_volume: float = 0.0
+    cum_volume: float = 0.0
+    vwap_tail: Deque[float] = field(init=False)
+    volume_tail: Deque[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.vwap_tail = deque(maxlen=self.window)
+        self.volume_tail = deque(maxlen=self.window)
+
+    def fold(self, price_volume: np.ndarray, volume: np.ndarray) -> None:
+        """Add consecutive bars, oldest first, to the running sums and tails."""
+        vwap = (self.cum_price_volume + _cumsum_skipna(price_volume)) / (self.cum_volume + _cumsum_skipna(volume))
+        self.vwap_tail.extend(vwap[-self.window :].tolist())
+        self.volume_tail.extend(volume[-self.window :].tolist())
+        self.cum_price_volume += float(np.nansum(price_volume))
+        self.cum_volume += float(np.nansum(volume, dtype=np.float64))
+
+
 class TradeBotVWAP(TradeBot):
     """
     Trading bot implementing Volume-Weighted Average Price (VWAP) strategy with enhanced features.
     """
 
+    # The price history columns the VWAP is computed from, in _price_columns' return order
+    _NUMERIC_COLS = ("high_price", "low_price", "close_price", "volume")
+
     def __init__(self, config: Optional[TradingConfig] = None) -> None:
         """Initialize the VWAP trading bot with configuration."""
         super().__init__(config if config else TradingConfig())
@@ -56,68 +104,244 @@ class TradeBotVWAP(TradeBot):
             "sharpe_ratio": 0.0,
         }
 
-        self.trade_history: List[Dict[str, Any]] = []
+        self.trade_history: List[TradeRecord] = []
         self.highest_equity = 0.0
 
+        # Running equity, its peak, and Welford accumulators over the per-trade
+        # returns of the equity curve, updated once per trade
+        self._running_total = 0.0
+        self._return_count = 0
+        self._return_mean = 0.0
+        self._return_m2 = 0.0
+
+        # The formatted summary only changes when a trade is recorded
+        self._summary_cache: Optional[PerformanceSummary] = None
+        self._summary_dirty = True
+
+        # (ticker, interval, span) -> (expiry on the monotonic clock, history DataFrame)
+        self._history_cache: Dict[Tuple[str, str, str], Tuple[float, pd.DataFrame]] = {}
+        # Backs the in-memory cache on disk, so a restart doesn't refetch fresh bars
+        self._bar_cache = BarCache()
+        self._vwap_state: Dict[Tuple[str, str], _VWAPState] = {}
+
+        self._warm_up_vwap_kernel()
+
+    def _warm_up_vwap_kernel(self) -> None:
+        """Compile the VWAP kernel for the configured window so the first long history pays no JIT cost."""
+        sample = np.ones(self.config.vwap.vwap_window + 1, dtype=np.float32)
+        make_vwap_bands_last(self.config.vwap.vwap_window)(sample, sample, sample, sample)
+
+    def _cached_history(self, ticker: str, interval: str, span: str, ttl: float) -> pd.DataFrame:
+        """
+        Return the price history for ticker, reusing a fetch made less than ttl seconds ago.
+
+        Fetches are kept in memory and in the on-disk bar cache; either is tried before the API.
+
+        :param ticker: The stock ticker.
+        :param interval: The interval of the data.
+        :param span: The span of the data.
+        :param ttl: Seconds a fetched history stays fresh.
+        :return: A DataFrame with the historical data.
+        """
+        key = (ticker, interval, span)
+        now = time.monotonic()
+        cached = self._history_cache.get(key)
+        if cached and now < cached[0]:
+            return cached[1]
+
+        stored = self._bar_cache.load(ticker, interval, span, ttl)
+        if stored is not None:
+            age, df = stored
+            self._history_cache[key] = (now + ttl - age, df)
+            return df
+
+        df = self.get_stock_history_dataframe(ticker, interval=interval, span=span)
+        # Failed or empty fetches are retried on the next call rather than cached
+        if not df.empty:
+            self._history_cache[key] = (now + ttl, df)
+            self._bar_cache.store(ticker, interval, span, df)
+        return df
+
+    @classmethod
+    def _price_columns(cls, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the (high, low, close, volume) columns of df as float arrays.
+
+        The float32 columns from get_stock_history_dataframe are returned as views; any
+        other column is converted to float64. Sums over them should accumulate in float64.
+        """
+        columns = []
+        for col in cls._NUMERIC_COLS:
+            series = df[col]
+            # get_stock_history_dataframe already converts these at ingest; only
+            # frames built elsewhere still need parsing
+            if not pd.api.types.is_numeric_dtype(series):
+                series = pd.to_numeric(series, errors="coerce")
+            dtype = np.float32 if series.dtype == np.float32 else np.float64
+            columns.append(series.to_numpy(dtype=dtype, copy=False))
+        return tuple(columns)
+
+    def _vwap_inputs(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (typical price * volume, volume) arrays of the bars in df, price_volume in float64."""
+        high, low, close, volume = self._price_columns(df)
+        typical_price = np.add(high, low, dtype=np.float64)
+        typical_price += close
+        typical_price /= 3
+        return typical_price * volume, volume
+
+    def _metrics_from_tail(self, vwap: np.ndarray, volume: np.ndarray, n_bars: int) -> VWAPMetrics:
+        """
+        Build VWAPMetrics from the latest VWAP and volume values.
+
+        :param vwap: The cumulative VWAP, ending at the latest bar (at least the last vwap_window values).
+        :param volume: The volume, aligned with vwap.
+        :param n_bars: The total number of bars the values were computed from.
+        """
+        # Only the latest rolling window is reported
+        window = self.config.vwap.vwap_window
+        if n_bars >= window:
+            vwap_std = float(vwap[-window:].std(ddof=1))
+            volume_sma = float(volume[-window:].mean(dtype=np.float64))
+        else:
+            vwap_std = volume_sma = np.nan
+
+        latest_vwap = float(vwap[-1])
+
+        return VWAPMetrics(
+            vwap=latest_vwap,
+            std_dev=vwap_std,
+            upper_band=latest_vwap + (2 * vwap_std),
+            lower_band=latest_vwap - (2 * vwap_std),
+            volume_ratio=float(volume[-1]) / volume_sma,
+        )
+
     def calculate_vwap_metrics(self, df: pd.DataFrame) -> VWAPMetrics:
         """Calculate VWAP and related metrics from price and volume data."""
         try:
-            df = df.copy()
-
-            for col in ["close_price", "volume", "high_price", "low_price"]:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            df["typical_price"] = (df["high_price"] + df["low_price"] + df["close_price"]) / 3
+            if len(df) > _VWAP_KERNEL_MIN_BARS:
+                kernel = make_vwap_bands_last(self.config.vwap.vwap_window)
+                return VWAPMetrics(*kernel(*self._price_columns(df)))
 
-            df["cum_vol"] = df["volume"].cumsum()
-            df["cum_vol_price"] = (df["typical_price"] * df["volume"]).cumsum()
+            price_volume, volume = self._vwap_inputs(df)
+            vwap = _cumsum_skipna(price_volume) / _cumsum_skipna(volume)
+            return self._metrics_from_tail(vwap, volume, len(vwap))
 
-            df["vwap"] = df["cum_vol_price"] / df["cum_vol"]
-
-            window = self.config.vwap.vwap_window
-            df["vwap_std"] = df["vwap"].rolling(window=window).std()
-            df["volume_sma"] = df["volume"].rolling(window=window).mean()
-            df["volume_ratio"] = df["volume"] / df["volume_sma"]
+        except (KeyError, ValueError, pd.errors.EmptyDataError) as e:
+            logger.error("Error calculating VWAP metrics: %s", str(e))
+            raise ValueError("VWAP calculation failed") from e
 
-            latest = df.iloc[-1]
+    def update_vwap_metrics(self, ticker: str, interval: str, df: pd.DataFrame) -> VWAPMetrics:
+        """
+        Calculate VWAP metrics for a ticker's history, folding in only the bars not seen before.
 
-            return VWAPMetrics(
-                vwap=latest["vwap"],
-                std_dev=latest["vwap_std"],
-                upper_band=latest["vwap"] + (2 * latest["vwap_std"]),
-                lower_band=latest["vwap"] - (2 * latest["vwap_std"]),
-                volume_ratio=latest["volume_ratio"],
-            )
+        The running sums and the last vwap_window VWAP/volume values are kept per
+        (ticker, interval). The newest bar may still be forming, so it is combined with
+        the state on each call rather than folded in. The state starts over whenever
+        the history's first bar changes, e.g. on a new trading day.
+        """
+        if df.empty or "begins_at" not in df:
+            return self.calculate_vwap_metrics(df)
 
+        try:
+            price_volume, volume = self._vwap_inputs(df)
         except (KeyError, ValueError, pd.errors.EmptyDataError) as e:
             logger.error("Error calculating VWAP metrics: %s", str(e))
             raise ValueError("VWAP calculation failed") from e
 
+        begins_at = df["begins_at"].to_numpy()
+        last = len(begins_at) - 1
+        window = self.config.vwap.vwap_window
+        key = (ticker, interval)
+        state = self._vwap_state.get(key)
+
+        start = 0
+        if state is not None and state.first_bar == begins_at[0] and state.window == window:
+            if state.last_bar is not None:
+                start = int(np.searchsorted(begins_at, state.last_bar, side="right"))
+        else:
+            state = None
+        if state is None or start > last:
+            state = self._vwap_state[key] = _VWAPState(first_bar=begins_at[0], window=window)
+            start = 0
+
+        if start < last:
+            state.fold(price_volume[start:last], volume[start:last])
+            state.last_bar = begins_at[last - 1]
+
+        latest_volume = float(volume[last])
+        latest_vwap = (state.cum_price_volume + price_volume[last]) / (state.cum_volume + latest_volume)
+        return self._metrics_from_tail(
+            np.array([*state.vwap_tail, latest_vwap]),
+            np.array([*state.volume_tail, latest_volume]),
+            len(begins_at),
+        )
+
+    def _with_session_bar(self, daily_df: pd.DataFrame, intraday_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return the daily bars with the latest session's bar rebuilt from the intraday bars.
+
+        The intraday history is fetched on a short TTL anyway, so aggregating its latest day
+        keeps the daily bands current without refetching the year of daily bars. Only the
+        last daily row is replaced (or appended, when the daily history doesn't have the
+        session yet).
+
+        :param daily_df: The daily price history.
+        :param intraday_df: The intraday price history.
+        :return: The daily OHLCV bars, ending with the latest session.
+        """
+        if daily_df.empty or intraday_df.empty or "begins_at" not in intraday_df or "begins_at" not in daily_df:
+            return daily_df
+
+        begins_at = intraday_df["begins_at"]
+        session = begins_at.iloc[-1].normalize()
+        in_session = (begins_at >= session).to_numpy()
+        high, low, close, volume = self._price_columns(intraday_df)
+        with warnings.catch_warnings():
+            # A session whose bars are all missing aggregates to NaN, as resample would
+            warnings.simplefilter("ignore", RuntimeWarning)
+            session_bar = {
+                "begins_at": session,
+                "open_price": intraday_df["open_price"].to_numpy()[in_session][0],
+                "high_price": np.nanmax(high[in_session]),
+                "low_price": np.nanmin(low[in_session]),
+                "close_price": close[in_session][-1],
+                "volume": np.nansum(volume[in_session], dtype=np.float64),
+            }
+
+        columns = list(session_bar)
+        daily_begins_at = daily_df["begins_at"]
+        completed = len(daily_df) - 1 if daily_begins_at.iloc[-1] >= session else len(daily_df)
+        session_row = pd.DataFrame(
+            {col: pd.Series([value], dtype=daily_df[col].dtype) for col, value in session_bar.items()}
+        )
+        return pd.concat([daily_df[columns].iloc[:completed], session_row], ignore_index=True)
+
     def make_trading_decision(
         self, ticker: str, current_price: float, position: Optional[Position] = None
     ) -> OrderType:
         """Make trading decision based on VWAP analysis and risk management."""
+        vwap_config = self.config.vwap
         try:
             # Get both intraday and daily data
-            intraday_df = self.get_stock_history_dataframe(ticker, interval="5minute", span="day")
-            daily_df = self.get_stock_history_dataframe(ticker, interval="day", span="year")
+            intraday_df = self._cached_history(ticker, "5minute", "day", vwap_config.intraday_ttl)
+            daily_df = self._cached_history(ticker, "day", "year", vwap_config.daily_ttl)
 
-            intraday_metrics = self.calculate_vwap_metrics(intraday_df)
-            daily_metrics = self.calculate_vwap_metrics(daily_df)
+            intraday_metrics = self.update_vwap_metrics(ticker, "5minute", intraday_df)
+            daily_metrics = self.update_vwap_metrics(ticker, "day", self._with_session_bar(daily_df, intraday_df))
 
             if position:
                 if self._check_risk_management(current_price, position):
                     return OrderType.SELL_RECOMMENDATION
 
             threshold = (
-                intraday_metrics.std_dev / intraday_metrics.vwap if self.config.vwap.enable_dynamic_threshold else 0.01
+                intraday_metrics.std_dev / intraday_metrics.vwap if vwap_config.enable_dynamic_threshold else 0.01
             )
 
             price_to_vwap = (current_price - intraday_metrics.vwap) / intraday_metrics.vwap
 
-            sufficient_volume = intraday_metrics.volume_ratio > self.config.vwap.volume_threshold
+            sufficient_volume = intraday_metrics.volume_ratio > vwap_config.volume_threshold
 
-            mean_reversion_threshold = self.config.vwap.mean_reversion_threshold
+            mean_reversion_threshold = vwap_config.mean_reversion_threshold
 
             if (
                 price_to_vwap < -threshold
@@ -142,41 +366,79 @@ class TradeBotVWAP(TradeBot):
 
     def _check_risk_management(self, current_price: float, position: Position) -> bool:
         """Enhanced risk management with trailing stops and volatility-adjusted thresholds."""
+        vwap_config = self.config.vwap
         try:
             position_value = current_price * position.quantity
+            position.highest_price = max(position.highest_price, position_value)
 
-            unrealized_pl = (current_price - position.average_buy_price) / position.average_buy_price
+            # The percentage thresholds expressed as prices, so the checks are plain comparisons
+            average_buy_price = position.average_buy_price
+            stop_loss_price = average_buy_price * (1 - vwap_config.stop_loss_percentage)
+            take_profit_price = average_buy_price * (1 + vwap_config.take_profit_percentage)
+            trailing_stop_value = position.highest_price * (1 - vwap_config.trailing_stop)
 
-            position.highest_price = max(position.highest_price, position_value)
+            stop_loss = current_price < stop_loss_price
+            take_profit = current_price > take_profit_price
+            trailing_stop = position_value < trailing_stop_value
+            oversized = position_value > vwap_config.max_position_size
 
-            if unrealized_pl < -self.config.vwap.stop_loss_percentage:
-                logger.info("Stop loss triggered at %s", unrealized_pl)
-                return True
+            if not (stop_loss | take_profit | trailing_stop | oversized):
+                return False
 
-            if unrealized_pl > self.config.vwap.take_profit_percentage:
+            unrealized_pl = (current_price - average_buy_price) / average_buy_price
+            if stop_loss:
+                logger.info("Stop loss triggered at %s", unrealized_pl)
+            elif take_profit:
                 logger.info("Take profit triggered at %s", unrealized_pl)
-                return True
-
-            trailing_stop_distance = self.config.vwap.trailing_stop
-            if (position.highest_price - position_value) / position.highest_price > trailing_stop_distance:
+            elif trailing_stop:
                 logger.info(
                     "Trailing stop triggered at %s",
                     position_value / position.highest_price,
                 )
-                return True
-
-            if position_value > self.config.vwap.max_position_size:
+            else:
                 logger.info("Maximum position size exceeded")
-                return True
-
-            return False
+            return True
 
         except (KeyError, ValueError) as e:
             logger.error("Error in risk management: %s", str(e))
             return False
 
+    def check_risk_management_batch(self, positions: PositionsTable, current_prices: np.ndarray) -> np.ndarray:
+        """
+        Apply the risk management checks to every position at once.
+
+        The vectorized equivalent of calling _check_risk_management per position: the
+        limits are evaluated on the table's columns, and its highest_price column is
+        raised in place.
+
+        :param positions: The positions to check.
+        :param current_prices: The current price of each position, in positions.tickers order.
+        :return: A boolean array, True where the position should be sold.
+        """
+        vwap_config = self.config.vwap
+        current_prices = np.asarray(current_prices, dtype=np.float64)
+        average_buy_price = positions.average_buy_price
+        highest_price = positions.highest_price
+
+        position_value = current_prices * positions.quantity
+        np.maximum(highest_price, position_value, out=highest_price)
+
+        triggered = (
+            (current_prices < average_buy_price * (1 - vwap_config.stop_loss_percentage))
+            | (current_prices > average_buy_price * (1 + vwap_config.take_profit_percentage))
+            | (position_value < highest_price * (1 - vwap_config.trailing_stop))
+            | (position_value > vwap_config.max_position_size)
+        )
+
+        if triggered.any():
+            tickers = positions.tickers
+            for idx in np.flatnonzero(triggered):
+                logger.info("Risk limit triggered for %s", tickers[idx])
+        return triggered
+
     def update_performance_metrics(self, trade_result: OrderResult) -> None:
         """Update performance tracking metrics after each trade."""
+        self._summary_dirty = True
         try:
             self.performance_metrics["total_trades"] += 1
 
@@ -190,22 +452,26 @@ class TradeBotVWAP(TradeBot):
             self.performance_metrics["total_profit_loss"] += profit_loss
 
             self.trade_history.append(
-                {
-                    "timestamp": datetime.now(),
-                    "profit_loss": profit_loss,
-                    "type": trade_result.details.get("side", "unknown"),
-                    "price": trade_result.price,
-                    "quantity": trade_result.amount,
-                }
+                TradeRecord(
+                    timestamp_ns=time.time_ns(),
+                    profit_loss=profit_loss,
+                    side=trade_result.details.get("side", "unknown"),
+                    price=trade_result.price,
+                    quantity=trade_result.amount,
+                )
             )
 
-            self._update_advanced_metrics()
+            self._update_advanced_metrics(profit_loss)
 
         except (KeyError, ValueError) as e:
             logger.error("Error updating performance metrics: %s", str(e))
 
-    def _update_advanced_metrics(self) -> None:
-        """Update advanced performance metrics."""
+    def _update_advanced_metrics(self, profit_loss: float) -> None:
+        """
+        Update advanced performance metrics with the latest trade.
+
+        :param profit_loss: The profit or loss of the trade just recorded.
+        """
         try:
             total_trades = self.performance_metrics["total_trades"]
             if total_trades == 0:
@@ -217,39 +483,93 @@ class TradeBotVWAP(TradeBot):
                 self.performance_metrics["total_profit_loss"] / total_trades
             )
 
-            equity_curve = []
-            running_total = 0
-            peak = 0
-            max_drawdown = 0
-
-            for trade in self.trade_history:
-                running_total += trade["profit_loss"]
-                equity_curve.append(running_total)
-                peak = max(peak, running_total)
-                drawdown = (peak - running_total) / peak if peak > 0 else 0
-                max_drawdown = max(max_drawdown, drawdown)
-
-            self.performance_metrics["max_drawdown"] = max_drawdown
-
-            if len(equity_curve) > 1:
-                returns = pd.Series(equity_curve).pct_change().dropna()
-                excess_returns = returns - 0.02 / 252
-                sharpe_ratio = (
-                    np.sqrt(252) * (excess_returns.mean() / excess_returns.std()) if excess_returns.std() != 0 else 0
+            previous_total = self._running_total
+            self._running_total += profit_loss
+            self.highest_equity = max(self.highest_equity, self._running_total)
+
+            peak = self.highest_equity
+            drawdown = (peak - self._running_total) / peak if peak > 0 else 0
+            self.performance_metrics["max_drawdown"] = max(self.performance_metrics["max_drawdown"], drawdown)
+
+            if total_trades > 1:
+                # Percent change of the equity curve; 0/0 is skipped like pct_change().dropna()
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    trade_return = np.float64(self._running_total) / previous_total - 1
+                if not np.isnan(trade_return):
+                    self._return_count += 1
+                    delta = trade_return - self._return_mean
+                    self._return_mean += delta / self._return_count
+                    self._return_m2 += delta * (trade_return - self._return_mean)
+
+            if self._return_count > 1:
+                excess_mean = self._return_mean - 0.02 / 252
+                return_std = np.sqrt(self._return_m2 / (self._return_count - 1))
+                self.performance_metrics["sharpe_ratio"] = (
+                    np.sqrt(252) * (excess_mean / return_std) if return_std != 0 else 0
                 )
-                self.performance_metrics["sharpe_ratio"] = sharpe_ratio
 
         except (KeyError, ValueError) as e:
             logger.error("Error updating advanced metrics: %s", str(e))
 
+    def recompute_performance_metrics(self) -> None:
+        """
+        Rebuild the performance metrics and running accumulators from trade_history.
+
+        For when trade_history is replaced or edited directly rather than grown through
+        update_performance_metrics; gives the same results as recording its trades one by one.
+        """
+        n = len(self.trade_history)
+        pnl = np.fromiter((trade.profit_loss for trade in self.trade_history), dtype=np.float64, count=n)
+        equity = np.cumsum(pnl)
+        # The peak starts from zero equity, so drawdown is only measured once the curve has been positive
+        peak = np.maximum(np.maximum.accumulate(equity), 0.0)
+        drawdown = np.divide(peak - equity, peak, out=np.zeros_like(equity), where=peak > 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = equity[1:] / equity[:-1] - 1
+        returns = returns[~np.isnan(returns)]
+
+        successful_trades = int(np.count_nonzero(pnl > 0))
+        total_profit_loss = float(pnl.sum())
+        metrics = self.performance_metrics
+        metrics["total_trades"] = n
+        metrics["successful_trades"] = successful_trades
+        metrics["failed_trades"] = n - successful_trades
+        metrics["total_profit_loss"] = total_profit_loss
+        metrics["win_rate"] = successful_trades / n if n else 0.0
+        metrics["average_profit_per_trade"] = total_profit_loss / n if n else 0.0
+        metrics["max_drawdown"] = float(drawdown.max()) if n else 0.0
+        metrics["sharpe_ratio"] = 0.0
+
+        self._running_total = float(equity[-1]) if n else 0.0
+        self.highest_equity = float(peak[-1]) if n else 0.0
+        self._return_count = len(returns)
+        self._return_mean = float(returns.mean()) if len(returns) else 0.0
+        self._return_m2 = float(((returns - self._return_mean) ** 2).sum())
+
+        if self._return_count > 1:
+            return_std = returns.std(ddof=1)
+            metrics["sharpe_ratio"] = (
+                np.sqrt(252) * ((self._return_mean - 0.02 / 252) / return_std) if return_std != 0 else 0
+            )
+
+        self._summary_dirty = True
+
     def get_performance_summary(self) -> PerformanceSummary:
         """Get a comprehensive summary of trading performance."""
-        return {
-            "total_trades": self.performance_metrics["total_trades"],
-            "win_rate": f"{self.performance_metrics['win_rate']:.2%}",
-            "total_profit_loss": f"${self.performance_metrics['total_profit_loss']:,.2f}",
-            "average_profit_per_trade": f"${self.performance_metrics['average_profit_per_trade']:,.2f}",
-            "max_drawdown": f"{self.performance_metrics['max_drawdown']:.2%}",
-            "sharpe_ratio": f"{self.performance_metrics['sharpe_ratio']:.2f}",
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        if self._summary_dirty or self._summary_cache is None:
+            self._summary_cache = {
+                "total_trades": self.performance_metrics["total_trades"],
+                "win_rate": f"{self.performance_metrics['win_rate']:.2%}",
+                "total_profit_loss": f"${self.performance_metrics['total_profit_loss']:,.2f}",
+                "average_profit_per_trade": f"${self.performance_metrics['average_profit_per_trade']:,.2f}",
+                "max_drawdown": f"{self.performance_metrics['max_drawdown']:.2%}",
+                "sharpe_ratio": f"{self.performance_metrics['sharpe_ratio']:.2f}",
+                "last_updated": "",
+            }
+            self._summary_dirty = False
+
+        # Everything but the timestamp only changes on a trade
+        summary = self._summary_cache.copy()
+        summary["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return summary
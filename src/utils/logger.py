@@ -1,14 +1,41 @@
 """This module contains the logger configuration for the trading bot."""
 
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set to DEBUG to capture all logs
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("trade_bot.log"),  # Log to a file named trade_bot.log
-        logging.StreamHandler(),  # Also log to the console
-    ],
-)
+# The format doesn't use thread or process info, so skip collecting it per record
+logging.logThreads = False
+logging.logProcesses = False
+
+# INFO by default; set LOG_LEVEL=DEBUG (or any other level name) to change it
+LOG_LEVEL = (os.getenv("LOG_LEVEL") or "INFO").upper()
+# getLevelName maps a known level name to its number, and anything else to a string
+_invalid_log_level = not isinstance(logging.getLevelName(LOG_LEVEL), int)
+if _invalid_log_level:
+    _requested_log_level, LOG_LEVEL = LOG_LEVEL, "INFO"
+
+_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_handlers = [
+    logging.FileHandler("trade_bot.log"),  # Log to a file named trade_bot.log
+    logging.StreamHandler(),  # Also log to the console
+]
+for _handler in _handlers:
+    _handler.setFormatter(_formatter)
+
+# Callers only enqueue records; a background listener thread does the file and console writes
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener = QueueListener(_log_queue, *_handlers, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
+_root = logging.getLogger()
+_root.setLevel(LOG_LEVEL)
+_root.addHandler(QueueHandler(_log_queue))
 
 logger = logging.getLogger(__name__)
+
+if _invalid_log_level:
+    logger.warning("Unknown LOG_LEVEL %r; using INFO", _requested_log_level)
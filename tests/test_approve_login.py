@@ -0,0 +1,35 @@
+"""This module contains tests for the interactive device-approval login."""
+
+import sys
+import time
+import types
+
+import approve_login
+
+
+def test_probe_error_backs_off_and_retries(monkeypatch):
+    def login(*args, **kwargs):
+        raise Exception("challenge required")
+
+    robinhood = types.SimpleNamespace(login=login)
+    monkeypatch.setitem(sys.modules, "robin_stocks", types.SimpleNamespace(robinhood=robinhood))
+    monkeypatch.setitem(sys.modules, "robin_stocks.robinhood", robinhood)
+
+    probes = []
+
+    def try_login(credentials):
+        probes.append(credentials)
+        if len(probes) == 1:
+            raise ConnectionError("network down")
+        return True
+
+    sleeps = []
+    monkeypatch.setattr(approve_login, "_try_login", try_login)
+    monkeypatch.setattr(approve_login, "_get_credentials", lambda: types.SimpleNamespace(user="u", password="p"))
+    monkeypatch.setattr(approve_login, "APPROVAL_PROBE_DELAYS", (0.01,))
+    monkeypatch.setattr(approve_login, "time", types.SimpleNamespace(sleep=sleeps.append, monotonic=time.monotonic))
+
+    assert approve_login.interactive_login_with_approval()
+    assert len(probes) == 2
+    # Request sleep, the first attempt's backoff, then the second attempt's request sleep
+    assert sleeps == [1, 20, 1]
@@ -0,0 +1,24 @@
+"""This module contains tests for the Parquet bar cache."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.bar_cache import BarCache
+
+pytest.importorskip("pyarrow")
+
+
+def test_store_overwrites_one_file_per_history(tmp_path):
+    cache = BarCache(str(tmp_path))
+    interval_dir = tmp_path / "AAPL" / "5minute"
+    interval_dir.mkdir(parents=True)
+    # A per-day file left by an older version of the cache
+    (interval_dir / "day-20240101.parquet").write_bytes(b"")
+
+    for close in (1.0, 2.0):
+        cache.store("AAPL", "5minute", "day", pd.DataFrame({"close": np.float32([close])}))
+
+    assert sorted(p.name for p in interval_dir.iterdir()) == ["day.parquet"]
+    _, df = cache.load("AAPL", "5minute", "day", ttl=60)
+    assert df["close"].tolist() == [2.0]
@@ -0,0 +1,49 @@
+"""This module contains equivalence tests for the compiled indicator kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies._indicator_kernels import macd_last
+
+
+def _pandas_macd(close: np.ndarray, fast: int, slow: int, signal: int):
+    """The pandas chain macd_last replaces."""
+    series = pd.Series(close)
+    macd = series.ewm(span=fast, adjust=False).mean() - series.ewm(span=slow, adjust=False).mean()
+    return macd.iloc[-1], macd.ewm(span=signal, adjust=False).mean().iloc[-1]
+
+
+def _random_close(rng: np.random.Generator, n: int) -> np.ndarray:
+    return 100 + rng.normal(0, 1, n).cumsum()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_macd_last_matches_pandas(seed):
+    close = _random_close(np.random.default_rng(seed), 250)
+    np.testing.assert_allclose(macd_last(close, 12, 26, 9), _pandas_macd(close, 12, 26, 9), rtol=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_macd_last_skips_missing_closes_like_pandas(seed):
+    rng = np.random.default_rng(seed)
+    close = _random_close(rng, 250)
+    close[0] = np.nan
+    close[rng.integers(1, 250, 10)] = np.nan
+    close[-1] = np.nan
+
+    result = macd_last(close, 12, 26, 9)
+
+    assert np.all(np.isfinite(result))
+    np.testing.assert_allclose(result, _pandas_macd(close, 12, 26, 9), rtol=1e-12)
+
+
+def test_macd_last_all_missing():
+    assert np.all(np.isnan(macd_last(np.full(30, np.nan), 12, 26, 9)))
+
+
+def test_macd_last_float32_input():
+    close = _random_close(np.random.default_rng(0), 250).astype(np.float32)
+    np.testing.assert_allclose(
+        macd_last(close, 12, 26, 9), _pandas_macd(close.astype(np.float64), 12, 26, 9), rtol=1e-9
+    )
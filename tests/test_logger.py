@@ -0,0 +1,35 @@
+"""This module contains tests for the logger configuration."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _import_logger(tmp_path: Path, log_level: str) -> subprocess.CompletedProcess:
+    """Import the logger in a fresh interpreter with LOG_LEVEL set, reporting the root level."""
+    env = {**os.environ, "LOG_LEVEL": log_level, "PYTHONPATH": str(_REPO_ROOT)}
+    code = "import logging, src.utils.logger; print(logging.getLevelName(logging.getLogger().level))"
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, check=False
+    )
+
+
+@pytest.mark.parametrize("log_level, expected", [("debug", "DEBUG"), ("WARNING", "WARNING"), ("", "INFO")])
+def test_log_level_from_environment(tmp_path, log_level, expected):
+    result = _import_logger(tmp_path, log_level)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == expected
+
+
+def test_unknown_log_level_falls_back_to_info(tmp_path):
+    result = _import_logger(tmp_path, "verbose")
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "INFO"
+    assert "Unknown LOG_LEVEL 'VERBOSE'; using INFO" in result.stderr
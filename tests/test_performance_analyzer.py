@@ -0,0 +1,29 @@
+"""This module contains tests for the PerformanceAnalyzer class."""
+
+from src.core.performance_analyzer import PerformanceAnalyzer
+
+
+def test_add_trade_keeps_long_tickers_and_extra_keys():
+    analyzer = PerformanceAnalyzer()
+    analyzer.add_trade(
+        {"ticker": "BRK.B-WARRANT", "quantity": 2, "price": 10.0, "profit_loss": 5.0, "side": "BUY", "order_id": "abc"}
+    )
+
+    (trade,) = analyzer.trade_history
+
+    assert trade["ticker"] == "BRK.B-WARRANT"
+    assert trade["order_id"] == "abc"
+    assert trade["side"] == "buy"
+    assert (trade["quantity"], trade["price"], trade["profit_loss"]) == (2.0, 10.0, 5.0)
+
+
+def test_trade_history_survives_growing_the_columns():
+    analyzer = PerformanceAnalyzer()
+    for i in range(PerformanceAnalyzer._INITIAL_CAPACITY + 10):
+        analyzer.add_trade({"ticker": f"T{i}", "profit_loss": float(i), "note": i})
+
+    history = analyzer.trade_history
+
+    assert len(history) == PerformanceAnalyzer._INITIAL_CAPACITY + 10
+    assert [trade["note"] for trade in history] == list(range(len(history)))
+    assert history[-1]["ticker"] == f"T{len(history) - 1}"
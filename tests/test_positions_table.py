@@ -0,0 +1,51 @@
+"""This module contains tests for the PositionsTable class."""
+
+import pytest
+
+from src.data.position import Position
+from src.data.positions_table import PositionsTable
+
+
+def _position(quantity: float, price: float) -> Position:
+    return Position(quantity, price, price, quantity * price, 0.0, 0.0, price)
+
+
+def test_writes_through_view_update_the_columns():
+    table = PositionsTable()
+    table["AAPL"] = _position(2.0, 100.0)
+    table["MSFT"] = _position(1.0, 300.0)
+
+    table["MSFT"].highest_price = 320.0
+    view = table["AAPL"]
+    view.current_price = 110.0
+    view.equity = view.quantity * view.current_price
+
+    assert table.highest_price.tolist() == [100.0, 320.0]
+    assert table.current_price.tolist() == [110.0, 300.0]
+    assert table.equity.sum() == 520.0
+    assert table["AAPL"] == Position(2.0, 100.0, 110.0, 220.0, 0.0, 0.0, 100.0)
+
+
+def test_view_follows_its_ticker_when_slots_move():
+    table = PositionsTable()
+    table["AAPL"] = _position(2.0, 100.0)
+    table["MSFT"] = _position(1.0, 300.0)
+    view = table["MSFT"]
+
+    del table["AAPL"]
+    view.highest_price = 350.0
+
+    assert table.tickers == ["MSFT"]
+    assert table.highest_price.tolist() == [350.0]
+    with pytest.raises(KeyError):
+        table["AAPL"]
+
+
+def test_snapshot_is_detached():
+    table = PositionsTable()
+    table["AAPL"] = _position(2.0, 100.0)
+
+    snapshot = table["AAPL"].snapshot()
+    snapshot.highest_price = 500.0
+
+    assert table["AAPL"].highest_price == 100.0
@@ -0,0 +1,109 @@
+"""This module contains tests for the background sentiment feed."""
+
+import sys
+import threading
+import types
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.config import SentimentAnalysisConfig
+from src.strategies import sentiment_feed, trading_strategies
+from src.strategies.sentiment_feed import SentimentFeed
+from src.utils.credentials import TwitterCredentials
+
+
+@pytest.fixture(name="fake_sentiment_stack")
+def fixture_fake_sentiment_stack(monkeypatch):
+    """Install stand-ins for tweepy, TextBlob and VADER; the first search raises."""
+    searches = []
+
+    def cursor(*args, **kwargs):
+        searches.append(kwargs)
+        if len(searches) == 1:
+            raise KeyError("data")
+        tweet = types.SimpleNamespace(
+            id=len(searches), full_text="great quarter", created_at=datetime.now(timezone.utc)
+        )
+        return types.SimpleNamespace(items=lambda limit: [tweet])
+
+    tweepy = types.SimpleNamespace(
+        AppAuthHandler=lambda *args: None, API=lambda *args, **kwargs: types.SimpleNamespace(search_tweets=None)
+    )
+    tweepy.Cursor = cursor
+    textblob = types.SimpleNamespace(
+        TextBlob=lambda text: types.SimpleNamespace(sentiment=types.SimpleNamespace(polarity=1.0))
+    )
+    vader = types.SimpleNamespace(
+        SentimentIntensityAnalyzer=lambda: types.SimpleNamespace(polarity_scores=lambda text: {"compound": 1.0})
+    )
+    monkeypatch.setitem(sys.modules, "tweepy", tweepy)
+    monkeypatch.setitem(sys.modules, "textblob", textblob)
+    monkeypatch.setitem(sys.modules, "vaderSentiment", types.SimpleNamespace(vaderSentiment=vader))
+    monkeypatch.setitem(sys.modules, "vaderSentiment.vaderSentiment", vader)
+    monkeypatch.setattr(sentiment_feed, "SENTIMENT_REFRESH_INTERVAL", 0.01)
+    return searches
+
+
+def test_feed_logs_errors_and_keeps_running(fake_sentiment_stack, caplog):
+    feed = SentimentFeed("AAPL", SentimentAnalysisConfig(), TwitterCredentials("key", "secret"))
+    try:
+        for _ in range(500):
+            if len(feed.recent_scores()):
+                break
+            threading.Event().wait(0.01)
+        assert feed.is_alive()
+    finally:
+        feed.stop()
+
+    assert feed.recent_scores().tolist() == [1.0]
+    assert "Error in sentiment analysis for AAPL" in caplog.text
+    assert len(fake_sentiment_stack) >= 2
+
+
+@pytest.fixture(autouse=True)
+def fixture_fresh_twitter_credentials():
+    """Reload the Twitter credentials in every test."""
+    trading_strategies._twitter_credentials.cache_clear()
+    yield
+    trading_strategies._twitter_credentials.cache_clear()
+
+
+def test_sentiment_signal_replaces_dead_feed(monkeypatch):
+    started = []
+
+    class FakeFeed:
+        def __init__(self, ticker, config, credentials):
+            started.append(ticker)
+
+        def is_alive(self):
+            return False
+
+        def recent_scores(self):
+            return []
+
+    monkeypatch.setattr(trading_strategies, "SentimentFeed", FakeFeed)
+    monkeypatch.setattr(trading_strategies, "TwitterCredentials", lambda: TwitterCredentials("key", "secret"))
+    monkeypatch.setattr(trading_strategies, "_SENTIMENT_FEEDS", {})
+    config = SentimentAnalysisConfig(enable_sentiment=True)
+
+    trading_strategies.calculate_sentiment_signal("AAPL", config)
+    trading_strategies.calculate_sentiment_signal("AAPL", config)
+
+    assert started == ["AAPL", "AAPL"]
+
+
+def test_sentiment_signal_loads_missing_credentials_once(monkeypatch, caplog):
+    loads = []
+
+    def credentials():
+        loads.append(1)
+        return TwitterCredentials(None, None)
+
+    monkeypatch.setattr(trading_strategies, "TwitterCredentials", credentials)
+    monkeypatch.setattr(trading_strategies, "_SENTIMENT_FEEDS", {})
+    config = SentimentAnalysisConfig(enable_sentiment=True)
+
+    assert [trading_strategies.calculate_sentiment_signal("AAPL", config) for _ in range(3)] == [0.0] * 3
+    assert len(loads) == 1
+    assert caplog.text.count("Twitter credentials are not set") == 1
@@ -0,0 +1,66 @@
+"""This module contains tests for the technical indicator signals."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.config import TechnicalIndicatorsConfig, TradingConfig
+from src.strategies.trading_strategies import (
+    calculate_macd_signal,
+    calculate_rsi_signal,
+    calculate_sma_signal,
+    calculate_vwap_signal,
+    precompute_indicators,
+)
+
+_SIGNALS = [calculate_sma_signal, calculate_vwap_signal, calculate_rsi_signal, calculate_macd_signal]
+
+
+def test_precompute_indicators_empty_frame_is_neutral():
+    config = TechnicalIndicatorsConfig()
+    df = pd.DataFrame({"close": np.array([], dtype=np.float32), "volume": np.array([], dtype=np.float32)})
+
+    indicators = precompute_indicators(df, config)
+
+    assert all(np.isnan(value) for value in indicators.values())
+    assert [signal(df, config, indicators) for signal in _SIGNALS] == [0.0] * len(_SIGNALS)
+
+
+def test_strategy_signals_neutral_when_resampling_leaves_no_bars(monkeypatch):
+    base_trade_bot = pytest.importorskip("src.core.base_trade_bot")
+
+    history = pd.DataFrame(
+        {
+            "begins_at": pd.date_range("2024-01-01", periods=5, freq="h", tz="UTC"),
+            "open_price": np.full(5, np.nan, dtype=np.float32),
+            "high_price": np.full(5, np.nan, dtype=np.float32),
+            "low_price": np.full(5, np.nan, dtype=np.float32),
+            "close_price": np.full(5, np.nan, dtype=np.float32),
+            "volume": np.zeros(5, dtype=np.float32),
+        }
+    )
+    bot = base_trade_bot.TradeBot.__new__(base_trade_bot.TradeBot)
+    bot.config = TradingConfig(decision_freq="1D")
+    monkeypatch.setattr(bot, "get_stock_history_dataframe", lambda *args, **kwargs: history)
+
+    signals = bot.calculate_strategy_signals("AAPL")
+
+    assert signals == dict.fromkeys(bot.config.enabled_strategies, 0.0)
+
+
+@pytest.mark.parametrize(
+    "close, volume",
+    [
+        ([1.0, 2.0], [0.0, 0.0]),
+        ([1.0, np.nan], [np.nan, 0.0]),
+        ([1.0, 2.0], [5.0, np.nan]),
+    ],
+)
+def test_vwap_signal_neutral_without_volume(close, volume):
+    config = TechnicalIndicatorsConfig()
+    df = pd.DataFrame({"close": np.float32(close), "volume": np.float32(volume)})
+
+    indicators = precompute_indicators(df, config)
+
+    assert np.isnan(indicators["vwap"])
+    assert calculate_vwap_signal(df, config, indicators) == 0.0
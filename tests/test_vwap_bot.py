@@ -0,0 +1,41 @@
+"""This module contains tests for the TradeBotVWAP class."""
+
+from datetime import datetime
+
+import pytest
+
+from src.data.order_result import OrderResult
+
+base_trade_bot = pytest.importorskip("src.core.base_trade_bot")
+vwap_bot = pytest.importorskip("src.strategies.vwap_bot")
+
+
+@pytest.fixture(name="bot")
+def fixture_bot(monkeypatch):
+    """A TradeBotVWAP that skips authentication."""
+    monkeypatch.setattr(base_trade_bot.TradeBot, "__init__", lambda self, config: setattr(self, "config", config))
+    return vwap_bot.TradeBotVWAP()
+
+
+def test_performance_summary_stamps_last_updated_on_every_call(bot, monkeypatch):
+    class FakeDatetime:
+        now_value = datetime(2024, 1, 2, 10, 0, 0)
+
+        @classmethod
+        def now(cls):
+            return cls.now_value
+
+    monkeypatch.setattr(vwap_bot, "datetime", FakeDatetime)
+    bot.update_performance_metrics(OrderResult(success=True, price=10.0, amount=2.0, details={"side": "sell"}))
+
+    first = bot.get_performance_summary()
+    FakeDatetime.now_value = datetime(2024, 1, 2, 10, 5, 0)
+    second = bot.get_performance_summary()
+
+    assert first["last_updated"] == "2024-01-02 10:00:00"
+    assert second["last_updated"] == "2024-01-02 10:05:00"
+    assert {**first, "last_updated": None} == {**second, "last_updated": None}
+    assert second["total_profit_loss"] == "$20.00"
+
+    bot.update_performance_metrics(OrderResult(success=True, price=5.0, amount=1.0, details={"side": "sell"}))
+    assert bot.get_performance_summary()["total_trades"] == 2
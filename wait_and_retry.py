@@ -2,14 +2,18 @@
 Single attempt login - USE ONLY AFTER WAITING 30-60 MINUTES!
 
 This script makes ONE careful attempt to log in after a rate limit cooldown.
+Pass --yes (or set ASSUME_YES=1) to skip the confirmation prompt, e.g. from a scheduler.
 """
 
-import time
+import os
+import sys
 from datetime import datetime
 import robin_stocks.robinhood as robinhood
 from src.utils.credentials import RobinhoodCredentials
 from src.utils.logger import logger
 
+_BAR = "=" * 70
+
 
 def single_careful_attempt():
     """
@@ -22,19 +26,22 @@ def single_careful_attempt():
     """
     credentials = RobinhoodCredentials()
     
-    logger.info("=" * 70)
+    logger.info(_BAR)
     logger.info("🔐 Robinhood Single Login Attempt")
-    logger.info("=" * 70)
+    logger.info(_BAR)
     logger.info("Time: %s", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     logger.info("User: %s", credentials.user)
-    logger.info("=" * 70)
+    logger.info(_BAR)
     logger.info("")
     logger.info("⚠️  IMPORTANT: Have you waited at least 30-60 minutes?")
     logger.info("⚠️  IMPORTANT: Can you log into Robinhood website?")
     logger.info("")
     
     try:
-        response = input("Continue with login attempt? (yes/no): ").strip().lower()
+        if os.getenv("ASSUME_YES") == "1" or "--yes" in sys.argv:
+            response = "yes"
+        else:
+            response = input("Continue with login attempt? (yes/no): ").strip().lower()
         if response != 'yes':
             logger.info("Cancelled. Good idea to wait longer!")
             return False
@@ -47,8 +54,6 @@ def single_careful_attempt():
     logger.info("Please wait...")
     logger.info("")
     
-    time.sleep(2)  # Brief pause
-    
     try:
         # Single attempt with SMS
         robinhood.login(
@@ -59,9 +64,9 @@ def single_careful_attempt():
             store_session=True  # Save session to avoid future logins
         )
         
-        logger.info("=" * 70)
+        logger.info(_BAR)
         logger.info("✅ SUCCESS! Logged in successfully!")
-        logger.info("=" * 70)
+        logger.info(_BAR)
         logger.info("")
         
         # Verify with account info
@@ -77,7 +82,7 @@ def single_careful_attempt():
         except Exception as e:
             logger.warning("Could not fetch profile: %s", e)
         
-        logger.info("=" * 70)
+        logger.info(_BAR)
         
         # Keep session active
         logger.info("")
@@ -93,9 +98,9 @@ def single_careful_attempt():
     except Exception as e:
         error_str = str(e)
         
-        logger.error("=" * 70)
+        logger.error(_BAR)
         logger.error("❌ Login attempt failed")
-        logger.error("=" * 70)
+        logger.error(_BAR)
         logger.error("Error: %s", error_str)
         logger.error("")
         
@@ -136,12 +141,12 @@ def single_careful_attempt():
             logger.error("  • Robinhood API maintenance")
             logger.error("")
         
-        logger.error("=" * 70)
+        logger.error(_BAR)
         logger.error("")
         logger.error("⚠️  DO NOT TRY AGAIN FOR AT LEAST 2 HOURS!")
         logger.error("")
         logger.error("Set a timer and wait. Each failed attempt extends the block.")
-        logger.error("=" * 70)
+        logger.error(_BAR)
         
         return False
 